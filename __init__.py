@@ -1 +1 @@
-from gambitparser import Parser, PayoffParser
+from gambitparser import Parser, PayoffParser, ResultCache, Stats, register_solver, payoffs_to_tensor, tensor_to_payoffs, solve_many
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#time every phase of Parser and PayoffParser over a grid of game sizes and payoff kinds
+#run as: python benchmarks/bench_games.py --players 2,3,4 --moves 2,3 --output results.json
+#and compare against an earlier run with: --baseline results.json --threshold 0.25
+#gambit-enumpure comes from benchmarks/bin when gambit is not installed
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, 'src'))
+import gambitparser
+
+KINDS = ('random', 'zerosum', 'anonymous')
+
+#payoffs between 0 and 99, the same for every run of a case
+def random_payoffs(seed):
+    def payoffs(paths):
+        return np.random.RandomState(seed).randint(0, 100, size = paths.shape)
+    return payoffs
+
+#the last player loses what the others win
+def zerosum_payoffs(seed):
+    def payoffs(paths):
+        outcomes = np.random.RandomState(seed).randint(-50, 50, size = paths.shape)
+        outcomes[:, -1] = -outcomes[:, :-1].sum(axis = 1)
+        return outcomes
+    return payoffs
+
+#each action pays more the fewer players share it
+def crowding_payoffs(counts):
+    return [10 * (action + 1) // max(count, 1) for action, count in enumerate(counts)]
+
+#keyword arguments of a Parser for one kind of payoffs
+def parser_options(kind, seed):
+    if kind == 'random':
+        return {'payoff_function': random_payoffs(seed)}
+    if kind == 'zerosum':
+        return {'payoff_function': zerosum_payoffs(seed)}
+    return {'count_payoffs': crowding_payoffs}
+
+#build, solve and parse one game, in a process of its own so the peak memory is the game's
+def run_case(case):
+    title = os.path.join(case['directory'], '{parser}-{kind}-{players}x{moves}-{solver}'.format(**case))
+    stats = gambitparser.Stats()
+    start = time.perf_counter()
+    if case['parser'] == 'Parser':
+        game = gambitparser.Parser(case['moves'], case['players'], solver = case['solver'], title = title,
+                                   diskless = case['diskless'], stats = stats, **parser_options(case['kind'], case['seed']))
+        game.build()
+        game.payoffs()
+    else:
+        #write the payoffs of the random game out as a payoff file first, outside the timings
+        source = gambitparser.Parser(case['moves'], case['players'], solver = 'backward', **parser_options(case['kind'], case['seed']))
+        source.build()
+        source.payoffs()
+        text_file_name = title + '.txt'
+        with open(text_file_name, 'w') as text_file:
+            for path, payoff in zip(source.all_paths.tolist(), np.asarray(source.outcomes).tolist()):
+                text_file.write('{}:{}\n'.format(','.join(map(str, path)), ','.join(map(str, payoff))))
+        start = time.perf_counter()
+        game = gambitparser.PayoffParser(text_file_name, solver = case['solver'], title = title,
+                                         diskless = case['diskless'], stats = stats)
+        game.preprocess()
+        game.build()
+    game.solve()
+    game.parse(verbose = False)
+    record = dict(case)
+    del record['directory']
+    record.update(stats.as_dict())
+    record['total'] = time.perf_counter() - start
+    record['equilibria'] = len(game.results_final)
+    #linux reports kilobytes
+    record['peak_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    record['solver_peak_rss_kb'] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return record
+
+#the fields that name a case, for matching runs against a baseline
+def case_key(record):
+    return tuple(record[field] for field in ('parser', 'kind', 'players', 'moves', 'solver'))
+
+#cases that got slower than the baseline by more than the threshold
+def regressions(records, baseline, threshold):
+    before = {case_key(record): record for record in baseline}
+    slower = []
+    for record in records:
+        old = before.get(case_key(record))
+        if old is not None and record['total'] > old['total'] * (1 + threshold):
+            slower.append((record, old))
+    return slower
+
+if __name__ == '__main__':
+    #add arguments to use in the command line
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--players', default = '2,3,4', help = 'comma separated numbers of players')
+    parser.add_argument('--moves', default = '2,3', help = 'comma separated numbers of moves')
+    parser.add_argument('--kinds', default = ','.join(KINDS), help = 'comma separated payoff kinds out of ' + ', '.join(KINDS))
+    parser.add_argument('--solvers', default = 'enumpureP,backward,nash', help = 'comma separated solvers')
+    parser.add_argument('--parsers', default = 'Parser,PayoffParser', help = 'comma separated parser classes')
+    parser.add_argument('--diskless', action = 'store_true', help = 'pipe the games to the solver instead of writing files')
+    parser.add_argument('--seed', type = int, default = 0)
+    parser.add_argument('--output', default = 'benchmark-results.json', help = 'where to write the results')
+    parser.add_argument('--baseline', help = 'earlier results to compare against')
+    parser.add_argument('--threshold', type = float, default = 0.25, help = 'allowed slowdown against the baseline, as a fraction')
+    args = parser.parse_args()
+
+    if shutil.which('gambit-enumpure') is None:
+        os.environ['PATH'] = os.path.join(HERE, 'bin') + os.pathsep + os.environ['PATH']
+
+    directory = tempfile.mkdtemp(prefix = 'gambitparser-bench-')
+    cases = [{'parser': parser_name, 'kind': kind, 'players': players, 'moves': moves, 'solver': solver,
+              'diskless': args.diskless, 'seed': args.seed, 'directory': directory}
+             for parser_name in args.parsers.split(',')
+             for kind in args.kinds.split(',')
+             for players in map(int, args.players.split(','))
+             for moves in map(int, args.moves.split(','))
+             for solver in args.solvers.split(',')]
+
+    #a fresh forked process per case keeps the peak memory of one game from leaking into the next
+    pool = multiprocessing.get_context('fork').Pool(1, maxtasksperchild = 1)
+    records = []
+    try:
+        for record in pool.imap(run_case, cases):
+            records.append(record)
+            print('{parser:<12} {kind:<9} {players}x{moves} {solver:<10} {total:8.3f} s {peak_rss_kb:>8} kb'.format(**record))
+    finally:
+        pool.close()
+        shutil.rmtree(directory, ignore_errors = True)
+
+    with open(args.output, 'w') as output:
+        json.dump({'python': sys.version.split()[0], 'records': records}, output, indent = 2, sort_keys = True)
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            slower = regressions(records, json.load(baseline)['records'], args.threshold)
+        for record, old in slower:
+            print('regression: {parser} {kind} {players}x{moves} {solver} took {total:.3f} s'.format(**record),
+                  'against {:.3f} s'.format(old['total']))
+        if slower:
+            sys.exit(1)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#check that importing gambitparser stays fast, using the import timings python prints with -X importtime
+#run as: python benchmarks/bench_import.py --target_ms 100
+
+import argparse
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src')
+
+#cumulative import time in microseconds of every module imported by one fresh interpreter
+def import_times():
+    environment = dict(os.environ, PYTHONPATH = SRC + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import gambitparser'],
+                             stderr = subprocess.PIPE, universal_newlines = True, env = environment)
+    if process.returncode != 0:
+        sys.exit(process.stderr)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+if __name__ == '__main__':
+    #add arguments to use in the command line
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--target_ms', type = float, default = 100, help = 'slowest acceptable import of gambitparser')
+    parser.add_argument('--runs', type = int, default = 5, help = 'fresh interpreters to time, keeping the fastest')
+    parser.add_argument('--top', type = int, default = 10, help = 'slowest imports to list')
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    best = min(runs, key = lambda times: times['gambitparser'])
+    total_ms = best['gambitparser'] / 1000
+    for name in ('gambit', 'pandas', 'numpy', 'subprocess', 'asyncio', 'multiprocessing'):
+        if name in best:
+            print('{} is imported eagerly'.format(name))
+    for name, cumulative in sorted(best.items(), key = lambda item: -item[1])[:args.top]:
+        print('{:>10.1f} ms  {}'.format(cumulative / 1000, name))
+    print('import gambitparser: {:.1f} ms (target {:.1f} ms)'.format(total_ms, args.target_ms))
+    if total_ms > args.target_ms:
+        sys.exit(1)
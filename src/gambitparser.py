@@ -4,42 +4,1176 @@
 #import to allow for decimal values as payoffs
 from __future__ import division
 from fractions import Fraction
+from math import gcd
 
 #ignore warnings
 import warnings
 warnings.filterwarnings("ignore")
 
-#import the gambit library
-import gambit
+#import importlib to load the heavy libraries on first use
+import importlib
 import itertools
 
+#a module that is only imported when one of its attributes is first used,
+#so short-lived processes that never reach it skip the import cost
+class LazyModule:
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+#the gambit library
+gambit = LazyModule('gambit')
+
 #import the time library to keep track of the script run time
 import time
 
-#import the subprocess,sys modules to call command-line functions
-import subprocess
+#the subprocess module to call command-line functions and sys
+subprocess = LazyModule('subprocess')
 import sys
 
-#import pandas and numpy to aid in parsing the game output
-import pandas as pd
-import numpy as np
+#multiprocessing and asyncio to solve many games at once
+multiprocessing = LazyModule('multiprocessing')
+shared_memory = LazyModule('multiprocessing.shared_memory')
+asyncio = LazyModule('asyncio')
+inspect = LazyModule('inspect')
+import weakref
+
+#import threading and queue to race solvers under time limits
+import threading
+import queue
+
+#resource caps solver memory and counts solver cpu time, but only unix has it
+try:
+    import resource
+except ImportError:
+    resource = None
+
+#pandas and numpy to aid in parsing the game output
+pd = LazyModule('pandas')
+np = LazyModule('numpy')
 
 #import logging to clean up print statements
 import logging
-    
+
+#import os, json and hashlib for the on-disk result cache
+import os
+import json
+import hashlib
+
+#import contextlib for the phase timers
+import contextlib
+
+#implicit game tree where each node id is a mixed-radix index
+#the nodes are numbered level by level, so the node for the actions (a1,...,ad)
+#sits at level_offsets[d] plus the base num_moves number (a1-1,...,ad-1)
+class GameTree:
+
+    def __init__(self, num_moves, num_players):
+        self.num_moves = num_moves
+        self.num_players = num_players
+        #first node id of every level, plus the total number of nodes at the end
+        self.level_offsets = [0]
+        for depth in range(num_players + 1):
+            self.level_offsets.append(self.level_offsets[-1] + num_moves**depth)
+        self.num_nodes = self.level_offsets[-1]
+        self.num_leaves = num_moves**num_players
+        self.num_infosets = self.level_offsets[num_players]
+
+    #depth of a node, which is also the index of the player who moves there
+    def depth(self, node):
+        depth = 0
+        while node >= self.level_offsets[depth + 1]:
+            depth += 1
+        return depth
+
+    #position of a node within its level
+    def index(self, node):
+        return node - self.level_offsets[self.depth(node)]
+
+    def parent(self, node):
+        depth = self.depth(node)
+        if depth == 0:
+            return None
+        return self.level_offsets[depth - 1] + (node - self.level_offsets[depth]) // self.num_moves
+
+    #label of the action that leads into a node
+    def action(self, node):
+        if node == 0:
+            return None
+        return self.index(node) % self.num_moves + 1
+
+    #node id of a leaf from its position in all_paths
+    def leaf(self, leaf_index):
+        return self.level_offsets[self.num_players] + leaf_index
+
+    #position in all_paths of the leaf reached by a path of actions
+    def leaf_index(self, path):
+        index = 0
+        for action in path:
+            index = index * self.num_moves + action - 1
+        return index
+
+    #actions that lead from the root to a leaf
+    def path(self, leaf_index):
+        node = self.leaf(leaf_index)
+        path = []
+        while node != 0:
+            path.append(self.action(node))
+            node = self.parent(node)
+        path.reverse()
+        return path
+
+    #actions of every leaf (or of the given leaves) at once, read off as the base num_moves digits of the leaf index
+    def paths(self, leaves = None):
+        if leaves is None:
+            leaves = np.arange(self.num_leaves, dtype=np.int64)
+        leaves = np.asarray(leaves, dtype=np.int64).reshape(-1, 1)
+        place = self.num_moves**np.arange(self.num_players - 1, -1, -1, dtype=np.int64)
+        return leaves // place % self.num_moves + 1
+
+    #build the equivalent gambit game, returning it with its terminal nodes in leaf order
+    def to_gambit(self, title):
+        game = gambit.Game.new_tree()
+        game.title = title
+        for i in range(self.num_players):
+            game.players.add('Player' + str(i + 1))
+        level = [game.root]
+        for depth in range(self.num_players):
+            children = []
+            for node in level:
+                move = node.append_move(game.players[depth], self.num_moves)
+                if depth == 0:
+                    move.label = 'Player1'
+                else:
+                    move.label = 'Player {} Chose {}'.format(depth, node.prior_action.label)
+                for i in range(self.num_moves):
+                    move.actions[i].label = str(i+1)
+                children.extend(node.children[i] for i in range(self.num_moves))
+            level = children
+        return game, level
+
+#find every subgame perfect outcome of the tree by backward induction
+#leaves are in the same order as all_paths, so the children of a node are consecutive
+#with float payoffs, payoffs within tolerance of each other count as ties
+def backward_induction(num_moves, num_players, outcomes, tolerance = 0):
+    #every node keeps the leaves it can reach under some subgame perfect continuation
+    level = [[leaf] for leaf in range(len(outcomes))]
+    for player in reversed(range(num_players)):
+        level = [survivors(level[start:start + num_moves], player, outcomes, tolerance) for start in range(0, len(level), num_moves)]
+    return level[0]
+
+#leaves that survive at a node, from the surviving leaves of its children and the player who moves there
+def survivors(children, player, outcomes, tolerance = 0):
+    #the lowest payoff the mover can be held to after each action
+    floors = [min(outcomes[leaf][player] for leaf in child) for child in children]
+    node = []
+    for i, child in enumerate(children):
+        #a tie survives when the mover can be kept from every other action
+        others = floors[:i] + floors[i + 1:]
+        for leaf in child:
+            if not others or outcomes[leaf][player] >= max(others) - tolerance:
+                node.append(leaf)
+    return node
+
+#the surviving leaves of every node, one list per depth from the root down to the leaves,
+#kept so that changed payoffs only need the nodes above them solved again
+def backward_levels(num_moves, num_players, outcomes, tolerance = 0):
+    levels = [[[leaf] for leaf in range(len(outcomes))]]
+    for player in reversed(range(num_players)):
+        level = levels[0]
+        levels.insert(0, [survivors(level[start:start + num_moves], player, outcomes, tolerance) for start in range(0, len(level), num_moves)])
+    return levels
+
+#solve again only the ancestors of the changed leaves, updating the levels in place
+def update_backward_levels(levels, num_moves, num_players, outcomes, leaves, tolerance = 0):
+    nodes = set(leaves)
+    for player in reversed(range(num_players)):
+        nodes = {node // num_moves for node in nodes}
+        for node in nodes:
+            start = node * num_moves
+            levels[player][node] = survivors(levels[player + 1][start:start + num_moves], player, outcomes, tolerance)
+    return levels[0][0]
+
+#gambit only takes exact numbers, so numpy scalars and floats are converted first
+def gambit_number(value):
+    if isinstance(value, (np.integer, np.floating)):
+        value = value.item()
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    return value
+
+#the gambit outcome with these payoffs, created the first time they come up and shared by every
+#leaf that has them, with interned mapping payoff vectors to the outcomes already in the game
+def intern_outcome(game, interned, payoff, label):
+    payoff = tuple(gambit_number(value) for value in payoff)
+    out = interned.get(payoff)
+    if out is None:
+        out = game.outcomes.add(label)
+        for k, value in enumerate(payoff):
+            out[k] = value
+        interned[payoff] = out
+    return out
+
+#payoff types for the numeric option: exact keeps the payoffs as given, scaled stores them as int64
+#over a common denominator, and float stores them as float64 and compares them within a tolerance
+NUMERIC_BACKENDS = ('exact', 'scaled', 'float')
+
+#convert the outcomes to a numeric backend, returning them with the denominator they are scaled by
+def numeric_outcomes(outcomes, numeric = 'exact'):
+    if numeric == 'exact':
+        return outcomes, 1
+    if numeric not in NUMERIC_BACKENDS:
+        sys.exit('numeric must be one of {}'.format(', '.join(NUMERIC_BACKENDS)))
+    outcomes = np.asarray(outcomes)
+    if numeric == 'float':
+        return outcomes.astype(np.float64, copy = False), 1
+    if outcomes.dtype.kind in 'iub':
+        return outcomes.astype(np.int64, copy = False), 1
+    values = [Fraction(gambit_number(value)) for value in outcomes.ravel().tolist()]
+    scale = 1
+    for value in values:
+        scale = scale * value.denominator // gcd(scale, value.denominator)
+    scaled = [value.numerator * (scale // value.denominator) for value in values]
+    if scaled and max(-min(scaled), max(scaled)) >= 2**63:
+        sys.exit('the payoffs do not fit in int64 over their common denominator {}'.format(scale))
+    return np.array(scaled, dtype=np.int64).reshape(outcomes.shape), scale
+
+#the exact payoffs of a leaf, undoing the common denominator of the scaled backend
+def exact_payoffs(payoff, scale = 1):
+    if scale == 1:
+        return payoff
+    return [Fraction(int(value), scale) for value in payoff]
+
+#write buffer for efg files, so large trees go to disk in big blocks
+EFG_BUFFER_SIZE = 1 << 20
+
+#most distinct payoff vectors the efg writer numbers as shared outcomes, which bounds its memory
+EFG_OUTCOME_LIMIT = 1 << 16
+
+#lines of the game in the efg format, one node per line in depth first order
+#only the stack of pending nodes is kept in memory, never the whole file
+#leaves with the same payoffs share one outcome, numbered in order of first appearance, and
+#every leaf after the first refers to it by number alone
+def efg_lines(tree, outcomes, title = 'Game', scale = 1):
+    num_moves, num_players = tree.num_moves, tree.num_players
+    players = ' '.join('"Player{}"'.format(i + 1) for i in range(num_players))
+    yield 'EFG 2 R "{}" {{ {} }}\n""\n\n'.format(title.replace('"', '\\"'), players)
+    actions = '{ ' + ' '.join('"{}"'.format(i + 1) for i in range(num_moves)) + ' }'
+
+    #format each distinct payoff once, up to a bounded number of them
+    formatted = {}
+    def format_payoff(value):
+        text = formatted.get(value)
+        if text is None:
+            text = str(gambit_number(value) if scale == 1 else Fraction(int(value), scale))
+            if len(formatted) < 4096:
+                formatted[value] = text
+        return text
+
+    outcome_numbers = {}
+    num_outcomes = 0
+    stack = [(0, 0)]
+    while stack:
+        depth, index = stack.pop()
+        if depth == num_players:
+            payoff = ', '.join(format_payoff(value) for value in outcomes[index])
+            number = outcome_numbers.get(payoff)
+            if number is not None:
+                yield 't "" {}\n'.format(number)
+                continue
+            num_outcomes += 1
+            if len(outcome_numbers) < EFG_OUTCOME_LIMIT:
+                outcome_numbers[payoff] = num_outcomes
+            yield 't "" {} "Player{} chose {}" {{ {} }}\n'.format(num_outcomes, num_players, index % num_moves + 1, payoff)
+        else:
+            label = 'Player1' if depth == 0 else 'Player {} Chose {}'.format(depth, index % num_moves + 1)
+            yield 'p "" {} {} "{}" {} 0\n'.format(depth + 1, index + 1, label, actions)
+            stack.extend((depth + 1, index * num_moves + i) for i in reversed(range(num_moves)))
+
+#stream the game to an open file in the efg format
+def write_efg(tree, outcomes, efg_file, title = 'Game', scale = 1):
+    for line in efg_lines(tree, outcomes, title, scale):
+        efg_file.write(line)
+
+#lines of a payoff file read per chunk, which bounds the text held in memory at once
+PAYOFF_CHUNK_LINES = 1 << 16
+
+#payoffs of one chunk of a payoff file, as integers when every value is whole
+def payoff_values(tokens):
+    if any('/' in token or '.' in token or 'e' in token or 'E' in token for token in tokens):
+        return np.array([Fraction(token) for token in tokens], dtype=object)
+    return np.array(tokens).astype(np.int64)
+
+#read a payoff file of "a1,a2,...:p1,p2,..." lines in chunks, from a file name, an open file or "-" for stdin
+#num_players is the number of actions on a line and num_moves the number of distinct actions,
+#and the outcomes come back as an (n_leaves, n_players) array in leaf order whatever the line order
+def read_payoffs(source, chunk_lines = PAYOFF_CHUNK_LINES):
+    if source == '-':
+        payoff_file, close = sys.stdin, False
+    elif hasattr(source, 'read'):
+        payoff_file, close = source, False
+    else:
+        payoff_file, close = open(source), True
+    action_chunks, payoff_chunks = [], []
+    num_players = None
+    try:
+        while True:
+            lines = list(itertools.islice(payoff_file, chunk_lines))
+            if not lines:
+                break
+            actions, payoffs = [], []
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                action_text, colon, payoff_text = line.partition(':')
+                if not colon:
+                    sys.exit('payoff line "{}" has no ":"'.format(line))
+                #the first line with payoffs sets the number of players for every other line
+                if num_players is None:
+                    num_players = action_text.count(',') + 1
+                if action_text.count(',') + 1 != num_players or payoff_text.count(',') + 1 != num_players:
+                    sys.exit('payoff line "{}" needs one action and one payoff for each of the {} players'.format(line, num_players))
+                actions.append(action_text)
+                payoffs.append(payoff_text)
+            if not actions:
+                continue
+            actions = np.array(','.join(actions).split(',')).astype(np.int64)
+            payoffs = payoff_values(','.join(payoffs).split(','))
+            action_chunks.append(actions.reshape(-1, num_players))
+            payoff_chunks.append(payoffs.reshape(-1, num_players))
+    finally:
+        if close:
+            payoff_file.close()
+    if num_players is None:
+        sys.exit('the payoff file is empty')
+    actions = np.concatenate(action_chunks)
+    payoffs = np.concatenate(payoff_chunks)
+    values = np.unique(actions)
+    num_moves = len(values)
+    if values[0] != 1 or values[-1] != num_moves or len(actions) != num_moves**num_players:
+        sys.exit('the payoff file needs one line for each of the {}**{} action profiles'.format(num_moves, num_players))
+    #the base num_moves digits of a leaf are its actions minus one
+    leaves = (actions - 1).dot(num_moves**np.arange(num_players - 1, -1, -1, dtype=np.int64))
+    outcomes = np.empty_like(payoffs)
+    outcomes[leaves] = payoffs
+    if len(np.unique(leaves)) != len(leaves):
+        sys.exit('the payoff file lists an action profile more than once')
+    return num_moves, num_players, outcomes
+
+#open a payoff tensor saved with np.save, of shape (num_moves, ..., num_moves, num_players)
+#the file is memory mapped, so pages are only read from disk when a leaf is touched
+def load_payoff_tensor(path):
+    tensor = np.load(path, mmap_mode='r')
+    num_players = tensor.ndim - 1
+    num_moves = tensor.shape[0] if num_players else 0
+    if num_players < 1 or tensor.shape != (num_moves,) * num_players + (num_players,):
+        sys.exit('a payoff tensor needs shape (num_moves, ..., num_moves, num_players), not {}'.format(tensor.shape))
+    #leaf i sits at the base num_moves digits of i, so the leaf order is the row major order
+    return num_moves, num_players, tensor.reshape(-1, num_players)
+
+#convert a text payoff file to a payoff tensor, as int64 when every payoff is whole and float64 otherwise
+def payoffs_to_tensor(text_file_name, tensor_file_name):
+    num_moves, num_players, outcomes = read_payoffs(text_file_name)
+    if outcomes.dtype == object:
+        if any(Fraction(value).denominator != 1 for value in outcomes.ravel()):
+            logging.warning('rational payoffs are stored as float64 in the payoff tensor')
+            outcomes = outcomes.astype(np.float64)
+        else:
+            outcomes = outcomes.astype(np.int64)
+    np.save(tensor_file_name, outcomes.reshape((num_moves,) * num_players + (num_players,)))
+    return num_moves, num_players
+
+#convert a payoff tensor back to a text payoff file, a chunk of leaves at a time
+def tensor_to_payoffs(tensor_file_name, text_file_name, chunk_lines = PAYOFF_CHUNK_LINES):
+    num_moves, num_players, outcomes = load_payoff_tensor(tensor_file_name)
+    tree = GameTree(num_moves, num_players)
+    with open(text_file_name, 'w', EFG_BUFFER_SIZE) as text_file:
+        for start in range(0, len(outcomes), chunk_lines):
+            leaves = np.arange(start, min(start + chunk_lines, len(outcomes)))
+            for path, payoff in zip(tree.paths(leaves).tolist(), outcomes[leaves].tolist()):
+                text_file.write('{}:{}\n'.format(','.join(map(str, path)), ','.join(map(repr, payoff))))
+    return num_moves, num_players
+
+#payoffs of an anonymous game, evaluated once per way of splitting the players among the actions
+#count_payoffs takes how many players chose each action and returns what each action pays
+def anonymous_table(num_moves, num_players, count_payoffs):
+    table = {}
+    for choice in itertools.combinations_with_replacement(range(num_moves), num_players):
+        counts = tuple(choice.count(action) for action in range(num_moves))
+        table[counts] = list(count_payoffs(counts))
+    return table
+
+#expand the table of an anonymous game to every leaf with one lookup per path
+def anonymous_outcomes(tree, table):
+    paths = tree.paths()
+    base = tree.num_players + 1
+    counts = np.stack([(paths == action + 1).sum(axis=1) for action in range(tree.num_moves)], axis=1)
+    codes = counts.dot(base**np.arange(tree.num_moves, dtype=np.int64))
+    keys = sorted(table, key=lambda key: sum(count * base**i for i, count in enumerate(key)))
+    rows = np.searchsorted([sum(count * base**i for i, count in enumerate(key)) for key in keys], codes)
+    payoffs = np.array([table[key] for key in keys])
+    return payoffs[rows.reshape(-1, 1), paths - 1]
+
+#backward induction for an anonymous game, where the rest of the game only depends on how many
+#players chose each action so far, so subtrees with the same counts are solved once
+def anonymous_backward_induction(num_moves, num_players, table, tolerance = 0):
+    #continuation outcomes of a state, as pairs of final counts and the remaining actions
+    solved = {}
+    def solve_state(depth, counts):
+        if (depth, counts) in solved:
+            return solved[(depth, counts)]
+        if depth == num_players:
+            outcomes = [(counts, ())]
+        else:
+            children = [solve_state(depth + 1, counts[:a] + (counts[a] + 1,) + counts[a + 1:]) for a in range(num_moves)]
+            #the lowest payoff the mover can be held to after each action
+            floors = [min(table[final][a] for final, _ in child) for a, child in enumerate(children)]
+            outcomes = []
+            for a, child in enumerate(children):
+                others = floors[:a] + floors[a + 1:]
+                for final, actions in child:
+                    if not others or table[final][a] >= max(others) - tolerance:
+                        outcomes.append((final, (a + 1,) + actions))
+        solved[(depth, counts)] = outcomes
+        return outcomes
+
+    leaves = []
+    for _, actions in solve_state(0, (0,) * num_moves):
+        leaf = 0
+        for action in actions:
+            leaf = leaf * num_moves + action - 1
+        leaves.append(leaf)
+    return leaves
+
+#payoffs that are only evaluated when a leaf is looked up, one path at a time
+class LazyOutcomes:
+
+    def __init__(self, tree, payoff_function):
+        self.tree = tree
+        self.payoff_function = payoff_function
+        self.evaluated = {}
+
+    def __len__(self):
+        return self.tree.num_leaves
+
+    def __getitem__(self, leaf):
+        leaf = int(leaf)
+        if not 0 <= leaf < self.tree.num_leaves:
+            raise IndexError(leaf)
+        if leaf not in self.evaluated:
+            self.evaluated[leaf] = np.asarray(self.payoff_function(self.tree.paths([leaf])))[0]
+        return self.evaluated[leaf]
+
+#alpha-beta search of a zero-sum game, returning Player1's value and the leaf of an optimal path
+#Player1, Player3, ... maximize Player1's payoff and Player2, Player4, ... minimize it,
+#so with two players this is the usual zero-sum game and with more it is a game between two teams
+def alphabeta(tree, outcomes, zero_sum = None):
+    num_moves, num_players = tree.num_moves, tree.num_players
+    if not zero_sum and num_players != 2:
+        sys.exit('alphabeta can only detect two-player constant-sum games, pass zero_sum = True for teams')
+    if not zero_sum and isinstance(outcomes, np.ndarray):
+        totals = outcomes[:, 0] + outcomes[:, 1]
+        if (totals != totals[0]).any():
+            sys.exit('alphabeta needs a constant-sum game')
+        zero_sum = True
+
+    #leaves are only evaluated when the search reaches them, checking the sum as it goes
+    totals = []
+    def leaf_value(leaf):
+        payoff = outcomes[leaf]
+        if not zero_sum:
+            totals.append(payoff[0] + payoff[1])
+            if totals[-1] != totals[0]:
+                sys.exit('alphabeta needs a constant-sum game')
+        return payoff[0]
+
+    #actions that caused cutoffs at each depth are tried first
+    history = [[0] * num_moves for _ in range(num_players)]
+    def search(depth, index, alpha, beta):
+        if depth == num_players:
+            return leaf_value(index), index
+        maximizing = depth % 2 == 0
+        best, best_leaf = None, None
+        for action in sorted(range(num_moves), key=lambda action: -history[depth][action]):
+            value, leaf = search(depth + 1, index * num_moves + action, alpha, beta)
+            if best is None or (value > best if maximizing else value < best):
+                best, best_leaf = value, leaf
+            if maximizing:
+                alpha = max(alpha, best)
+            else:
+                beta = min(beta, best)
+            if alpha >= beta:
+                history[depth][action] += 2**(num_players - depth)
+                break
+        return best, best_leaf
+
+    return search(0, 0, float('-inf'), float('inf'))
+
+#leaves of every pure nash equilibrium outcome, checking all unilateral deviations at once
+#choices off the equilibrium path never change the outcome, so they can always hold a deviator
+#down to the worst leaf under their deviation; a path is an equilibrium outcome exactly when
+#no mover earns more than that after any deviation
+def pure_nash(num_moves, num_players, outcomes, tolerance = 0):
+    outcomes = np.asarray(outcomes)
+    equilibria = np.ones(len(outcomes), dtype=bool)
+    for depth in range(num_players):
+        payoff = outcomes[:, depth]
+        #worst payoff of the mover under each of their actions, then the best of those per node
+        floors = payoff.reshape(num_moves**(depth + 1), -1).min(axis=1)
+        deviation = floors.reshape(num_moves**depth, num_moves).max(axis=1)
+        equilibria &= payoff >= np.repeat(deviation - tolerance, num_moves**(num_players - depth))
+    return np.flatnonzero(equilibria)
+
+#payoffs of the game being solved in parallel, attached once in each worker process,
+#and the shared memory block they live in, kept open for as long as the worker reads them
+parallel_payoffs = None
+parallel_memory = None
+
+#attach a worker to the payoffs, either a shared memory block or a .npy file that is memory mapped
+def attach_payoffs(kind, name, dtype, shape):
+    global parallel_payoffs, parallel_memory
+    if kind == 'npy':
+        parallel_payoffs = np.load(name, mmap_mode='r').reshape(shape)
+    else:
+        parallel_memory = shared_memory.SharedMemory(name = name)
+        parallel_payoffs = np.ndarray(shape, dtype = dtype, buffer = parallel_memory.buf)
+
+#backward induction within one subtree below the split depth, returning its surviving leaves
+def solve_subtree(task):
+    num_moves, num_players, depth, first_leaf, num_leaves, tolerance = task
+    #a list of the subtree's payoffs is much faster to index than the array
+    outcomes = parallel_payoffs[first_leaf:first_leaf + num_leaves].tolist()
+    level = [[leaf] for leaf in range(num_leaves)]
+    for player in reversed(range(depth, num_players)):
+        level = [survivors(level[start:start + num_moves], player, outcomes, tolerance) for start in range(0, len(level), num_moves)]
+    return [first_leaf + leaf for leaf in level[0]]
+
+#backward induction across a process pool: the top split_depth levels cut the tree into
+#num_moves**split_depth subtrees that are solved independently, reading the payoffs from shared
+#memory (or from the memory mapped payoff tensor) instead of copying them to every worker,
+#and their surviving leaves are then combined up to the root in this process
+def parallel_backward_induction(num_moves, num_players, outcomes, tolerance = 0, workers = None, split_depth = None):
+    workers = workers or os.cpu_count()
+    outcomes = outcomes if isinstance(outcomes, np.ndarray) else np.asarray(outcomes)
+    if outcomes.dtype == object or num_players < 2 or workers < 2:
+        #exact rationals cannot be shared without copying, so they are solved in this process
+        return backward_induction(num_moves, num_players, outcomes, tolerance)
+    if split_depth is None:
+        #a few subtrees per worker keeps them all busy when some subtrees finish early
+        split_depth = 1
+        while split_depth < num_players - 1 and num_moves**split_depth < 4 * workers:
+            split_depth += 1
+    split_depth = max(1, min(split_depth, num_players - 1))
+    subtree_leaves = num_moves**(num_players - split_depth)
+    tasks = [(num_moves, num_players, split_depth, subtree * subtree_leaves, subtree_leaves, tolerance)
+             for subtree in range(num_moves**split_depth)]
+
+    memory = None
+    filename = getattr(outcomes, 'filename', None)
+    if isinstance(outcomes, np.memmap) and filename and filename.endswith('.npy'):
+        source = ('npy', filename, outcomes.dtype, outcomes.shape)
+    else:
+        memory = shared_memory.SharedMemory(create = True, size = max(outcomes.nbytes, 1))
+        np.ndarray(outcomes.shape, dtype = outcomes.dtype, buffer = memory.buf)[...] = outcomes
+        source = ('shm', memory.name, outcomes.dtype, outcomes.shape)
+    try:
+        pool = multiprocessing.get_context('fork').Pool(workers, initializer = attach_payoffs, initargs = source)
+        try:
+            level = pool.map(solve_subtree, tasks, chunksize = max(1, len(tasks) // (4 * workers)))
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        if memory is not None:
+            memory.close()
+            memory.unlink()
+
+    #combine the subtrees at the top levels
+    for player in reversed(range(split_depth)):
+        level = [survivors(level[start:start + num_moves], player, outcomes, tolerance) for start in range(0, len(level), num_moves)]
+    return level[0]
+
+#most entries a strategic form payoff tensor may have
+STRATEGIC_FORM_LIMIT = 10**8
+
+#leaf reached by every pure strategy profile, as a tensor with one axis per player
+#player d moves at num_moves**d information sets, so they have num_moves**(num_moves**d) pure strategies,
+#and strategy s plays the base num_moves digits of s at the information sets, the first set on the first digit
+#every information set is reached by some play of the others, so no two strategies are equivalent
+#and the reduced strategic form is the whole strategic form
+def strategy_leaves(num_moves, num_players):
+    sizes = [num_moves**(num_moves**depth) for depth in range(num_players)]
+    if float(np.prod(sizes, dtype=float)) * num_players > STRATEGIC_FORM_LIMIT:
+        sys.exit('the strategic form would have {} strategy profiles, too many to build'.format(' x '.join(map(str, sizes))))
+    node = np.zeros((1,) * num_players, dtype=np.int64)
+    for depth, size in enumerate(sizes):
+        shape = [1] * num_players
+        shape[depth] = size
+        strategies = np.arange(size, dtype=np.int64).reshape(shape)
+        #node is the information set the player is at, which picks the digit of their strategy
+        place = num_moves**(num_moves**depth - 1 - node)
+        node = node * num_moves + strategies // place % num_moves
+    return node
+
+#payoff tensor of the strategic form, one axis per player and the players' payoffs on the last axis
+def strategic_form_payoffs(num_moves, num_players, outcomes):
+    outcomes = outcomes if isinstance(outcomes, np.ndarray) else np.asarray(outcomes)
+    return outcomes[strategy_leaves(num_moves, num_players)]
+
+#pure strategy profiles that are Nash equilibria of a strategic form tensor, one row of strategies each
+#a profile is an equilibrium when every player's payoff is a best response along their own axis
+def strategic_pure_nash(payoffs, tolerance = 0):
+    num_players = payoffs.ndim - 1
+    equilibria = np.ones(payoffs.shape[:-1], dtype=bool)
+    for player in range(num_players):
+        payoff = payoffs[..., player]
+        equilibria &= payoff >= payoff.max(axis=player, keepdims=True) - tolerance
+    return np.argwhere(equilibria)
+
+#leaves reached by every pure Nash equilibrium of the strategic form, one per equilibrium,
+#as an in-process stand in for enumpureP on games small enough to build the strategic form of
+def strategic_nash(num_moves, num_players, outcomes, tolerance = 0):
+    leaves = strategy_leaves(num_moves, num_players)
+    outcomes = outcomes if isinstance(outcomes, np.ndarray) else np.asarray(outcomes)
+    profiles = strategic_pure_nash(outcomes[leaves], tolerance)
+    return leaves[tuple(profiles.T)]
+
+#solvers that run inside the process instead of calling gambit
+NATIVE_SOLVERS = {'backward': backward_induction, 'parallel': parallel_backward_induction, 'alphabeta': alphabeta, 'nash': pure_nash, 'strategic': strategic_nash}
+
+#gambit command line tools that print behavior profiles for extensive games, by solver name
+EXTERNAL_SOLVERS = {
+    'enumpureP': ['gambit-enumpure', '-P'],
+    'lcp': ['gambit-lcp'],
+    'lp': ['gambit-lp'],
+    'enumpoly': ['gambit-enumpoly'],
+    'liap': ['gambit-liap'],
+}
+
+#add a solver under a name, either as a gambit style command line or as an in-process
+#function taking (num_moves, num_players, outcomes) and returning the equilibrium leaves
+#a function that also takes a tolerance keyword is handed the tie tolerance of float payoffs
+def register_solver(name, command = None, function = None):
+    if function is not None:
+        NATIVE_SOLVERS[name] = function
+    elif command is not None:
+        EXTERNAL_SOLVERS[name] = list(command)
+    else:
+        sys.exit('register_solver needs a command or a function')
+
+#equilibrium leaves from a native solver, merging equal continuation states in anonymous games
+def native_leaves(game, solver = None):
+    solver = solver or game.solver
+    if solver == 'alphabeta':
+        game.game_value, leaf = alphabeta(game.tree, game.outcomes, getattr(game, 'zero_sum', None))
+        return [leaf]
+    #only float payoffs hand a tolerance to the solver
+    options = {'tolerance': game.tolerance} if game.tolerance else {}
+    if solver == 'backward' and (game.levels is not None or game.dirty_leaves):
+        #once payoffs have been updated, keep every node's survivors and solve again only above changed leaves
+        if game.levels is None:
+            game.levels = backward_levels(game.num_moves, game.num_players, game.outcomes, **options)
+        else:
+            update_backward_levels(game.levels, game.num_moves, game.num_players, game.outcomes, game.dirty_leaves, **options)
+        game.dirty_leaves = set()
+        return game.levels[0][0]
+    if solver == 'backward' and getattr(game, 'anonymous_table', None) is not None:
+        return anonymous_backward_induction(game.num_moves, game.num_players, game.anonymous_table, **options)
+    function = NATIVE_SOLVERS[solver]
+    if options and not takes_tolerance(function):
+        options = {}
+    return function(game.num_moves, game.num_players, game.outcomes, **options)
+
+#whether a solver function accepts the tolerance keyword
+def takes_tolerance(function):
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(parameter.name == 'tolerance' or parameter.kind == parameter.VAR_KEYWORD for parameter in parameters)
+
+#cap the address space of the current process, which is the memory limit linux enforces
+def limit_memory(max_memory):
+    if max_memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+#function that caps the memory of a solver process as it starts, or None without a cap
+def memory_limiter(max_memory):
+    if max_memory is None:
+        return None
+    if resource is None:
+        sys.exit('max_memory needs the resource module, which this platform does not have')
+    return lambda: limit_memory(max_memory)
+
+#start a native solver in a forked child under the game's memory cap, returning the child and
+#the end of the pipe its leaves and game value come back on, so the child can be killed at any time
+def start_native(game, solver = None):
+    solver = solver or game.solver
+    memory_limiter(game.max_memory)
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex = False)
+    def solve_child():
+        try:
+            limit_memory(game.max_memory)
+            leaves = [int(leaf) for leaf in native_leaves(game, solver)]
+            sender.send((leaves, getattr(game, 'game_value', None)))
+        except BaseException as error:
+            sender.send(error)
+    process = context.Process(target = solve_child)
+    process.start()
+    sender.close()
+    return process, receiver
+
+#wait for a forked native solver, killing it after timeout seconds, and return its leaves and game value
+def receive_native(process, receiver, solver, timeout = None):
+    try:
+        if not receiver.poll(timeout):
+            raise subprocess.TimeoutExpired(solver, timeout)
+        try:
+            result = receiver.recv()
+        except EOFError:
+            sys.exit('solver {} died, most likely from running out of memory or being killed'.format(solver))
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+#run a native solver in a forked child, so it can be held to the game's timeout and memory cap
+def run_native_limited(game, solver = None, timeout = None):
+    solver = solver or game.solver
+    process, receiver = start_native(game, solver)
+    leaves, game_value = receive_native(process, receiver, solver, game.timeout if timeout is None else timeout)
+    if game_value is not None:
+        game.game_value = game_value
+    return leaves
+
+#command line for a gambit solver
+def solver_command(solver):
+    if solver in EXTERNAL_SOLVERS:
+        return list(EXTERNAL_SOLVERS[solver])
+    sys.exit('unknown solver')
+
+#start the gambit solver on a parser's game, feeding it the efg over stdin in diskless mode
+def start_solver(game, stderr = None, solver = None):
+    command = solver_command(solver or game.solver)
+    if stderr is None:
+        stderr = subprocess.PIPE
+    limits = memory_limiter(game.max_memory)
+    if game.diskless:
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=stderr, universal_newlines=True, preexec_fn=limits)
+        try:
+            write_efg(game.tree, game.outcomes, process.stdin, game.title, game.scale)
+        except IOError:
+            #the solver quit early, its stderr says why
+            pass
+    else:
+        command.append(game.game_file.name)
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr, universal_newlines=True, preexec_fn=limits)
+    return command, process
+
+#wait for a solver process, killing it if it runs past the timeout
+def communicate_within(process, timeout = None):
+    try:
+        return process.communicate(timeout = timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        raise
+
+#run several solvers on a game at once and keep the first that finds an equilibrium,
+#killing the others, returning the winning solver with its equilibrium leaves
+#native solvers run in forked children like the gambit tools run in subprocesses, so the losers
+#can be killed, stay under max_memory and never touch the game after the race
+def race_solvers(game, solvers):
+    if not game.diskless and any(solver not in NATIVE_SOLVERS for solver in solvers):
+        if getattr(game, 'game_file', None) is None:
+            game.save_game()
+    finished = queue.Queue()
+    processes = []
+    lock = threading.Lock()
+    done = threading.Event()
+
+    #fork the native solvers before any thread starts
+    children = {}
+    for solver in solvers:
+        if solver in NATIVE_SOLVERS:
+            children[solver] = start_native(game, solver)
+            processes.append(children[solver][0])
+
+    def run(solver):
+        try:
+            if solver in NATIVE_SOLVERS:
+                process, receiver = children[solver]
+                leaves, game_value = receive_native(process, receiver, solver)
+            else:
+                with lock:
+                    if done.is_set():
+                        return
+                    command, process = start_solver(game, solver = solver)
+                    processes.append(process)
+                stdout, stderr = process.communicate()
+                leaves = decode_profiles(game.tree, parse_profiles(stdout)) if process.returncode == 0 else []
+                game_value = None
+            finished.put((solver, leaves, game_value))
+        except (Exception, SystemExit):
+            finished.put((solver, [], None))
+
+    for solver in solvers:
+        threading.Thread(target = run, args = (solver,), daemon = True).start()
+    deadline = None if game.timeout is None else time.time() + game.timeout
+    winner = None
+    try:
+        for _ in solvers:
+            remaining = None if deadline is None else max(deadline - time.time(), 0)
+            try:
+                solver, leaves, game_value = finished.get(timeout = remaining)
+            except queue.Empty:
+                #out of time, reported like a single solver that runs past the timeout
+                raise subprocess.TimeoutExpired(','.join(solvers), game.timeout)
+            if len(leaves):
+                winner = solver, leaves
+                if game_value is not None:
+                    game.game_value = game_value
+                break
+    finally:
+        with lock:
+            done.set()
+            for process in processes:
+                process.kill()
+    if winner is None:
+        sys.exit('no solver in the race found an equilibrium')
+    return winner
+
+#decode the NE lines of the solver output into a matrix of behavior profiles
+#pure solvers print 0 and 1, the others print rationals or decimals
+def parse_profiles(stdout):
+    rows = [line.strip().split(',')[1:] for line in stdout.splitlines() if line.startswith('NE,')]
+    if not rows:
+        return np.zeros((0, 0), dtype=np.int64)
+    rows = np.array(rows)
+    try:
+        return rows.astype(np.int64)
+    except ValueError:
+        return np.vectorize(lambda value: float(Fraction(value)))(rows)
+
+#rows of a profile matrix that play every action with probability 0 or 1
+def pure_profiles(profiles):
+    profiles = np.asarray(profiles)
+    return ((profiles == 0) | (profiles == 1)).all(axis=1)
+
+#leaves reached by the pure rows of a matrix of behavior profiles, one equilibrium per row
+#mixed rows, which lcp, lp, enumpoly and liap can print, do not follow one path and are left out
+#player d has num_moves**d infosets, so their block of a profile has num_moves**(d+1) entries
+def decode_profiles(tree, profiles):
+    profiles = np.asarray(profiles)
+    profiles = profiles[pure_profiles(profiles)] if profiles.size else profiles
+    rows = np.arange(len(profiles)).reshape(-1, 1)
+    actions = np.arange(tree.num_moves)
+    start = 0
+    index = np.zeros(len(profiles), dtype=np.int64)
+    for depth in range(tree.num_players):
+        columns = start + index.reshape(-1, 1) * tree.num_moves + actions
+        index = index * tree.num_moves + profiles[rows, columns].argmax(axis=1)
+        start += tree.num_moves**(depth + 1)
+    return index
+
+#yield each equilibrium path with its payoffs as soon as the solver prints it,
+#killing the solver once max_equilibria have been found
+def iter_solver_equilibria(game, max_equilibria = None):
+    if game.solver in NATIVE_SOLVERS:
+        leaves = native_leaves(game)
+        for leaf in leaves[:max_equilibria]:
+            #native solvers may hand back numpy integers, and paths are plain ints like in parse()
+            leaf = int(leaf)
+            yield tuple(game.tree.path(leaf)), exact_payoffs(game.outcomes[leaf], game.scale)
+        return
+    if max_equilibria == 0:
+        return
+    command, process = start_solver(game, stderr = subprocess.DEVNULL)
+    try:
+        if process.stdin:
+            process.stdin.close()
+        found = 0
+        for line in iter(process.stdout.readline, ''):
+            if not line.startswith('NE,'):
+                continue
+            leaves = decode_profiles(game.tree, parse_profiles(line))
+            if not len(leaves):
+                continue
+            leaf = int(leaves[0])
+            yield tuple(game.tree.path(leaf)), exact_payoffs(game.outcomes[leaf], game.scale)
+            found += 1
+            if max_equilibria is not None and found >= max_equilibria:
+                break
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.wait()
+
+#change the payoffs of some leaves of a built game in place, reusing its gambit outcomes
+#changes maps leaf indices or paths of actions to the new payoffs of those leaves,
+#and the changed leaves are kept in dirty_leaves so backward induction only solves again above them
+def update_game_payoffs(game, changes):
+    leaves, payoffs = [], []
+    for key, payoff in dict(changes).items():
+        if isinstance(key, (tuple, list)):
+            #a path needs one action in 1..num_moves for every player
+            if len(key) != game.num_players or not all(1 <= action <= game.num_moves for action in key):
+                sys.exit('{} is not a path of {} actions between 1 and {}'.format(key, game.num_players, game.num_moves))
+            leaf = game.tree.leaf_index(key)
+        else:
+            leaf = int(key)
+        if not 0 <= leaf < game.tree.num_leaves or len(payoff) != game.num_players:
+            sys.exit('cannot set the payoffs of leaf {} to {}'.format(key, payoff))
+        leaves.append(leaf)
+        payoffs.append(list(payoff))
+    if not leaves:
+        return leaves
+
+    if isinstance(game.outcomes, LazyOutcomes):
+        for leaf, payoff in zip(leaves, payoffs):
+            game.outcomes.evaluated[leaf] = np.asarray(payoff)
+    else:
+        outcomes = np.asarray(game.outcomes)
+        scale = game.scale
+        if game.numeric == 'float':
+            values = np.array([[float(gambit_number(value)) for value in payoff] for payoff in payoffs])
+        elif game.numeric == 'scaled':
+            values = [Fraction(gambit_number(value)) * game.scale for payoff in payoffs for value in payoff]
+            if any(value.denominator != 1 for value in values):
+                #the new payoffs need a larger common denominator, so scale every payoff again
+                exact = np.array([exact_payoffs(payoff, game.scale) for payoff in outcomes.tolist()], dtype=object)
+                exact[leaves] = np.array(payoffs, dtype=object)
+                outcomes, game.scale = numeric_outcomes(exact, 'scaled')
+                values = outcomes[leaves]
+            else:
+                values = np.array([int(value) for value in values], dtype=np.int64).reshape(len(leaves), -1)
+        else:
+            values = np.asarray(payoffs)
+            dtype = np.result_type(outcomes.dtype, values.dtype)
+            if dtype != outcomes.dtype:
+                outcomes = outcomes.astype(dtype)
+        #a memory mapped payoff tensor is read only, so it is copied on the first change
+        if not outcomes.flags.writeable:
+            outcomes = np.array(outcomes)
+        outcomes[leaves] = values
+        game.outcomes = outcomes
+        if isinstance(game.flat_outs, list) and game.scale != scale:
+            #every payoff was scaled again, not only the changed ones
+            game.flat_outs = outcomes.ravel().tolist()
+        elif isinstance(game.flat_outs, list):
+            for leaf in leaves:
+                game.flat_outs[leaf * game.num_players:(leaf + 1) * game.num_players] = outcomes[leaf].tolist()
+        elif game.flat_outs is not None:
+            game.flat_outs = outcomes.ravel()
+
+    #the changed payoffs are no longer a function of the action counts
+    game.anonymous_table = None
+    game.dirty_leaves.update(leaves)
+    game.equilibrium_leaves = None
+    game.cache_hit = False
+
+    #the changed leaves are pointed at the outcomes for their new payoffs, and the efg file is written again for the gambit solvers
+    if game._game is not None:
+        label = game._game.players[game.num_players - 1].label
+        for leaf in leaves:
+            out = intern_outcome(game._game, game.interned_outcomes, exact_payoffs(game.outcomes[leaf], game.scale), "{} chose {}".format(label, leaf % game.num_moves + 1))
+            game.assigned_outcomes[leaf] = out
+            game.terminal_nodes[leaf].outcome = out
+    if game.solver not in NATIVE_SOLVERS and not game.diskless:
+        game.save_game()
+    return leaves
+
+#cpu seconds used by the child processes this process has waited on, or 0 where resource is missing
+def children_cpu_time():
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+#durations of the phases of a game, measured with perf_counter while it is built, solved and parsed
+#every phase also records the cpu time of the process and of the solver processes it waited on,
+#hooks are called with (phase, seconds) as each phase ends, and tracer, if given, maps a phase
+#name to a context manager that is entered around the phase, such as a profiler or a tracing span
+class Stats:
+
+    def __init__(self, hooks = None, tracer = None):
+        self.durations = {}
+        self.cpu = {}
+        self.counters = {}
+        self.hooks = list(hooks or [])
+        self.tracer = tracer
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+        return hook
+
+    #time a phase, adding to its totals when it runs more than once
+    @contextlib.contextmanager
+    def phase(self, name):
+        trace = self.tracer(name) if self.tracer is not None else contextlib.nullcontext()
+        with trace:
+            wall, cpu = time.perf_counter(), time.process_time() + children_cpu_time()
+            try:
+                yield self
+            finally:
+                wall = time.perf_counter() - wall
+                cpu = time.process_time() + children_cpu_time() - cpu
+                self.durations[name] = self.durations.get(name, 0) + wall
+                self.cpu[name] = self.cpu.get(name, 0) + cpu
+                for hook in self.hooks:
+                    hook(name, wall)
+
+    #record a size or count, such as the bytes the solver printed
+    def count(self, name, value):
+        self.counters[name] = value
+
+    def as_dict(self):
+        return {'durations': dict(self.durations), 'cpu': dict(self.cpu), 'counters': dict(self.counters)}
+
+    #the stats as json, also written to path when one is given
+    def to_json(self, path = None):
+        text = json.dumps(self.as_dict(), indent = 2, sort_keys = True)
+        if path is not None:
+            with open(path, 'w') as stats_file:
+                stats_file.write(text)
+        return text
+
+#on-disk cache of solved games, keyed by a hash of the tree shape, the payoffs and the solver
+#entries are json files and the least recently used ones are evicted past max_bytes
+class ResultCache:
+
+    def __init__(self, directory = '.gambitparser-cache', max_bytes = 100 * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    #hash of everything that decides the equilibria of a game
+    def key(self, game):
+        digest = hashlib.sha256('{},{},{},{},{}\n'.format(game.num_moves, game.num_players, game.solver, game.scale, game.tolerance).encode())
+        outcomes = np.asarray(game.outcomes)
+        if outcomes.dtype == object:
+            for value in outcomes.ravel():
+                digest.update(str(gambit_number(value)).encode() + b',')
+        else:
+            digest.update(outcomes.dtype.str.encode())
+            digest.update(np.ascontiguousarray(outcomes).tobytes())
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+    #read an entry, marking it as recently used
+    def get(self, key):
+        try:
+            with open(self.path(key)) as entry_file:
+                entry = json.load(entry_file)
+            os.utime(self.path(key), None)
+        except (IOError, OSError, ValueError):
+            return None
+        return entry
+
+    #write an entry atomically, then evict down to the size cap
+    #the game value of alphabeta is kept exactly, as an integer or as the text of a fraction
+    def put(self, key, leaves, game_value = None):
+        entry = {'leaves': [int(leaf) for leaf in leaves]}
+        if game_value is not None:
+            game_value = gambit_number(game_value)
+            entry['game_value'] = game_value if isinstance(game_value, int) else str(game_value)
+        temp_name = '{}.{}.tmp'.format(self.path(key), os.getpid())
+        with open(temp_name, 'w') as entry_file:
+            json.dump(entry, entry_file)
+        os.replace(temp_name, self.path(key))
+        self.evict()
+
+    #drop the least recently used entries until the cache fits in max_bytes
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
 #class for parser
 class Parser:
     
-    def __init__(self, num_moves, num_players, outcomes = [],solver = 'enumpureP',title = 'Game'):
-        self.game = gambit.Game.new_tree()
+    def __init__(self, num_moves, num_players, outcomes = [],solver = 'enumpureP',title = 'Game', payoff_function = None, diskless = False, cache = None, count_payoffs = None, zero_sum = None, timeout = None, max_memory = None, numeric = 'exact', tolerance = 1e-9, stats = None):
         self.num_moves = num_moves
         self.num_players = num_players
         self.outcomes = outcomes
+        #optional callable taking the whole path matrix and returning every payoff at once
+        self.payoff_function = payoff_function
+        #optional callable for anonymous games, mapping how many players chose each action to what each action pays
+        self.count_payoffs = count_payoffs
+        self.anonymous_table = None
+        #set for alphabeta when the game is known to be zero-sum, instead of checking the leaves
+        self.zero_sum = zero_sum
         self.solver = solver
         self.title = title
+        #keep the efg and solver output off disk unless save_game() is called
+        self.diskless = diskless
+        #optional ResultCache shared between games
+        self.cache = cache
+        self.cache_hit = False
+        self.cache_key = None
+        #wall clock limit in seconds and address space limit in bytes for every solver run
+        self.timeout = timeout
+        self.max_memory = max_memory
+        self.solved_by = None
+        self.equilibrium_leaves = None
+        #payoffs are kept as given, as int64 over a common denominator, or as float64 compared within tolerance
+        self.numeric = numeric
+        self.tolerance = tolerance if numeric == 'float' else 0
+        self.scale = 1
+        #durations of every phase, see Stats
+        self.stats = stats if stats is not None else Stats()
+        #leaves changed by update_payoffs, and every node's backward induction survivors once there are any
+        self.dirty_leaves = set()
+        self.levels = None
+        self.flat_outs = None
+        self.tree = None
+        self._game = None
+
+    #the gambit game is only created when an export or a gambit solver needs it
+    @property
+    def game(self):
+        if self._game is None:
+            with self.stats.phase('gambit_tree'):
+                self._game, self.terminal_nodes = self.tree.to_gambit(self.title)
+            #gambit outcomes by payoff vector
+            self.interned_outcomes = {}
+            #carry over the payoffs once they are known
+            if len(self.outcomes):
+                self.assign_payoffs()
+        return self._game
         
     #build the game
-    def build(self):
+    def build(self, as_list = False):
         
         #get start time
         def start_time():
@@ -48,138 +1182,73 @@ class Parser:
             return self.start_Time
         
         start_time()
-            
-        #make game title
-        def game_title():
-            self.game.title = self.title
-            return self.game.title
-            
-        game_title()
-
-        #add the player names
-        def add_players():
-            for i in range(self.num_players):
-                self.game.players.add('Player' + str(i + 1))
-            return self.game.players
-                
-        add_players()
-    
-        #define number of infosets
-        def infosetter():
-            self.num_infosets = 0
-            for x in range(self.num_players):
-                self.num_infosets += self.num_moves**x
-            return self.num_infosets
-    
-        #create the root node
-        def create_node() :
-            if len(self.game.infosets) == 0:
-                move = self.game.root.append_move(self.game.players[0],self.num_moves)
-                move.label = 'Player1'
-                for i in range(self.num_moves) :
-                    move.actions[i].label = str(i+1)
-    
-        create_node()
-    
-        #create all subsequent nodes
-        def create_subsequent_nodes() :
-            for info in self.game.infosets:
-                if len(self.game.infosets) < infosetter():
-                    for member in info.members:
-                        if member.is_terminal == False:
-                            for i in range(self.num_moves):
-                                move = member.children[i].append_move(self.game.players[member.player.number+1],self.num_moves)
-                                move.label = 'Player {} Chose {}'.format(member.player.number+1,i+1)
-                                for i in range(self.num_moves):
-                                    move.actions[i].label = str(i+1)
-                else:
-                    break
-    
-        create_subsequent_nodes()
-    
-        ##get all the terminal nodes
-        def get_terminal_nodes() :
-            self.terminal_nodes = []
-            for infoset in self.game.infosets:
-                if self.game.players[len(self.game.players)-1].label in infoset.player.label:
-                    for member in infoset.members:
-                        for i in range(len(member.children)):
-                            self.terminal_nodes.append(member.children[i])
-            return self.terminal_nodes
-    
-        get_terminal_nodes()
+
+        #lay out the tree without creating any gambit nodes
+        def make_tree():
+            self.tree = GameTree(self.num_moves, self.num_players)
+            self.num_infosets = self.tree.num_infosets
+            return self.tree
+
+        with self.stats.phase('tree'):
+            make_tree()
     
-        #get the paths
+        #get the paths as an (n_leaves, n_players) array, or as lists if asked for
+        #alphabeta with a payoff function only looks at the leaves it visits, so it gets no paths
         def get_paths():
-            self.all_paths =[]
-            for i in range(len(self.terminal_nodes)):
-                prelim_paths =[]
-                while self.terminal_nodes[i].parent != None:
-                    prelim_paths.append(int(self.terminal_nodes[i].prior_action.label))
-                    self.terminal_nodes[i] = self.terminal_nodes[i].parent
-                self.all_paths.append(prelim_paths)
-            for path in self.all_paths:
-                path.reverse()
-    
+            if self.solver == 'alphabeta' and self.payoff_function is not None and self.count_payoffs is None:
+                self.all_paths = None
+                return self.all_paths
+            self.all_paths = self.tree.paths()
+            if as_list:
+                self.all_paths = self.all_paths.tolist()
             return self.all_paths
     
-        get_paths()
+        with self.stats.phase('paths'):
+            get_paths()
         
-        return self.start_Time, self.game.title, self.game.players, self.terminal_nodes, self.all_paths
+        return self.start_Time, self.tree, self.all_paths
     
     #make the payoffs of the game
     def payoffs(self): 
+        #evaluate the payoff function on every path in one call
+        def batch_outcomes():
+            if self.count_payoffs is not None:
+                self.anonymous_table = anonymous_table(self.num_moves, self.num_players, self.count_payoffs)
+                self.outcomes = anonymous_outcomes(self.tree, self.anonymous_table)
+            elif self.payoff_function is not None and self.solver == 'alphabeta':
+                #alphabeta only evaluates the leaves it visits
+                self.outcomes = LazyOutcomes(self.tree, self.payoff_function)
+                return self.outcomes
+            elif self.payoff_function is not None:
+                self.outcomes = self.payoff_function(np.asarray(self.all_paths))
+            self.outcomes = np.asarray(self.outcomes)
+            if self.outcomes.shape != (self.tree.num_leaves, self.num_players):
+                sys.exit('expected payoffs of shape {}, got {}'.format((self.tree.num_leaves, self.num_players), self.outcomes.shape))
+            self.outcomes, self.scale = numeric_outcomes(self.outcomes, self.numeric)
+            return self.outcomes
+
+        with self.stats.phase('outcomes'):
+            batch_outcomes()
+
+        #new payoffs replace any earlier ones, including in a gambit game that already exists
+        self.dirty_leaves = set()
+        self.levels = None
+        if self._game is not None:
+            self.assign_payoffs()
+
         #flatten the outcomes
         def flat_outs():  
-            flatten = itertools.chain.from_iterable
-            self.flat_outs = list(flatten(self.outcomes))
+            if isinstance(self.outcomes, LazyOutcomes):
+                self.flat_outs = None
+            else:
+                self.flat_outs = self.outcomes.ravel()
             return self.flat_outs
         
         flat_outs()
-        
-        #get the terminal nodes
-        def get_terminal_nodes() :
-            self.terminal_nodes = []
-            for infoset in self.game.infosets:
-                if self.game.players[len(self.game.players)-1].label in infoset.player.label:
-                    for member in infoset.members:
-                        for i in range(len(member.children)):
-                            self.terminal_nodes.append(member.children[i])
-            return self.terminal_nodes
-    
-        #reset the terminal nodes
-        def reset_terminal_nodes():
-            self.terminal_nodes = get_terminal_nodes()
-            return self.terminal_nodes
-    
-        reset_terminal_nodes()
-    
-        #assign the payoffs at each terminal node
-        def assign_payoffs():
-            self.assigned_outcomes = []
-            for i in range(len(self.outcomes)):
-                for j in range(self.num_moves):
-                    out = self.game.outcomes.add("{} chose {}".format(self.game.players[len(self.game.players)-1].label,j+1))
-                    self.assigned_outcomes.append(out)
-            for out, j in zip(self.assigned_outcomes, range(len(self.outcomes))):
-                for k in range(self.num_players):
-                    out[k] = self.outcomes[j][k]
-            for node, out in zip(self.terminal_nodes, self.assigned_outcomes):
-                for i in range(self.num_players):
-                    node.outcome = out
-            return self.assigned_outcomes, self.terminal_nodes
-    
-        assign_payoffs()
-    
-        #save the game to the efg format
-        def save_game():
-            self.efg = self.game.write('efg')
-            self.game_file = open("{}-output.efg".format(self.game.title), "w")
-            self.game_file.write(self.efg)
-            self.game_file.close()
-            return self.efg, self.game_file
-        
-        save_game()
+
+        #only the gambit solvers need the efg file
+        if self.solver not in NATIVE_SOLVERS and not self.diskless:
+            self.save_game()
         
         #runtime to build the game
         def game_time():
@@ -188,23 +1257,51 @@ class Parser:
         
         game_time()
 
-        return self.flat_outs, self.assigned_outcomes, self.terminal_nodes, self.efg, self.game_file, self.game_time
-    
+        return self.flat_outs, self.game_time
+
+    #assign the payoffs to the terminal nodes of the gambit game
+    def assign_payoffs(self):
+        with self.stats.phase('assign_outcomes'):
+            #creating the gambit tree also fills in the terminal nodes
+            players = self.game.players
+            #leaves with the same payoffs share one outcome, and outcomes already in the game are reused
+            self.assigned_outcomes = []
+            for j in range(len(self.outcomes)):
+                label = "{} chose {}".format(players[self.num_players-1].label, j % self.num_moves + 1)
+                out = intern_outcome(self.game, self.interned_outcomes, exact_payoffs(self.outcomes[j], self.scale), label)
+                self.assigned_outcomes.append(out)
+            for node, out in zip(self.terminal_nodes, self.assigned_outcomes):
+                node.outcome = out
+        return self.assigned_outcomes, self.terminal_nodes
+
+    #stream the game to the efg format without building it in gambit
+    def save_game(self):
+        self.game_file = open("{}-output.efg".format(self.title), "w", EFG_BUFFER_SIZE)
+        with self.stats.phase('efg_write'), self.game_file:
+            write_efg(self.tree, self.outcomes, self.game_file, self.title, self.scale)
+        return self.game_file
+
     #solve the game
     def solve(self):
+        #a game solved before comes straight from the cache
+        if self.lookup_cache():
+            return self.equilibrium_leaves, self.results_final, self.solve_time
+
+        #solve the game in process for the native solvers
+        self.solved_by = self.solver
+        if self.solver in NATIVE_SOLVERS:
+            return self.solve_native()
+
         #solve the game using the terminal
         def solve_external():
-            # can take value "enumpureP"
-            if self.solver == 'enumpureP':
-                self.command = ['gambit-' +self.solver[:-1], '-P']
-            else:
-                sys.exit('unknown solver')
-            self.command.append(self.game_file.name)
-            self.process = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            self.stdout, self.stderr = self.process.communicate()
+            self.equilibrium_leaves = None
+            self.command, self.process = start_solver(self)
+            self.stdout, self.stderr = communicate_within(self.process, self.timeout)
+            self.stats.count('stdout_bytes', len(self.stdout))
             return self.stdout,self.command, self.process, self.stderr
 
-        solve_external()
+        with self.stats.phase('solver'):
+            solve_external()
 
         #runtime to solve the game
         def solve_time():
@@ -215,259 +1312,179 @@ class Parser:
 
         return self.stdout,self.command, self.process, self.stderr, self.solve_time
 
-    #parse for the ideal output format
-    def parse(self):
+    #yield the equilibria one at a time as the solver prints them
+    def iter_equilibria(self, max_equilibria = None):
+        return iter_solver_equilibria(self, max_equilibria)
+
+    #change the payoffs of some leaves without building the game again, see update_game_payoffs
+    def update_payoffs(self, changes):
+        return update_game_payoffs(self, changes)
+
+    #the strategic form payoff tensor, in the units of the numeric backend, and its pure Nash equilibria
+    #as rows of strategy indices, see strategy_leaves for how strategies are numbered
+    def strategic_form(self):
+        self.strategic_payoffs = strategic_form_payoffs(self.num_moves, self.num_players, self.outcomes)
+        self.strategic_equilibria = strategic_pure_nash(self.strategic_payoffs, self.tolerance)
+        return self.strategic_payoffs, self.strategic_equilibria
+
+    #solve the game from an event loop, sharing the cap on running solvers
+    async def solve_async(self, timeout = None):
+        if self.lookup_cache():
+            return self.equilibrium_leaves, self.results_final, self.solve_time
+        self.solved_by = self.solver
+        if self.solver in NATIVE_SOLVERS:
+            #native solvers run in a worker thread so the event loop stays free, and past the timeout
+            #their forked child is killed like a solver process
+            async with solver_semaphore():
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(None, self.solve_native, timeout)
+                except subprocess.TimeoutExpired:
+                    raise asyncio.TimeoutError()
+        self.equilibrium_leaves = None
+        with self.stats.phase('solver'):
+            self.command, self.process, self.stdout, self.stderr = await run_solver_async(self, self.timeout if timeout is None else timeout)
+        self.stats.count('stdout_bytes', len(self.stdout))
+        self.solve_time = time.time()
+        return self.stdout,self.command, self.process, self.stderr, self.solve_time
+
+    #parse the game in a worker thread so the event loop stays free
+    async def parse_async(self, verbose = True):
+        return await asyncio.get_running_loop().run_in_executor(None, self.parse, verbose)
+
+    #run several solvers at once, keeping the first to find an equilibrium and killing the rest
+    def race(self, solvers):
+        def run_race():
+            self.solved_by, self.equilibrium_leaves = race_solvers(self, solvers)
+            self.results_final = [tuple(self.tree.path(leaf)) for leaf in self.equilibrium_leaves]
+            return self.solved_by, self.equilibrium_leaves, self.results_final
+
+        with self.stats.phase('solver'):
+            run_race()
+
+        #runtime to solve the game
+        def solve_time():
+            self.solve_time = time.time()
+            return self.solve_time
+
+        solve_time()
+
+        return self.solved_by, self.equilibrium_leaves, self.results_final, self.solve_time
+
+    #fill in the equilibria from the cache, if the game has been solved before
+    def lookup_cache(self):
+        self.cache_hit = False
+        self.cache_key = None
+        #hashing payoffs that are only evaluated on demand would evaluate every leaf, so they are not cached
+        if self.cache is not None and not isinstance(self.outcomes, LazyOutcomes):
+            self.cache_key = self.cache.key(self)
+            entry = self.cache.get(self.cache_key)
+            if entry is not None:
+                self.cache_hit = True
+                self.equilibrium_leaves = entry['leaves']
+                if entry.get('game_value') is not None:
+                    self.game_value = Fraction(entry['game_value'])
+                self.results_final = [tuple(self.tree.path(leaf)) for leaf in self.equilibrium_leaves]
+                self.solve_time = time.time()
+        return self.cache_hit
+
+    #solve the game without leaving the process
+    def solve_native(self, timeout = None):
+        timeout = self.timeout if timeout is None else timeout
+        def solve_backward():
+            if timeout is None and self.max_memory is None:
+                self.equilibrium_leaves = native_leaves(self)
+            else:
+                self.equilibrium_leaves = run_native_limited(self, timeout = timeout)
+            self.results_final = [tuple(self.tree.path(leaf)) for leaf in self.equilibrium_leaves]
+            return self.equilibrium_leaves, self.results_final
+
+        with self.stats.phase('solver'):
+            solve_backward()
+
+        #runtime to solve the game
+        def solve_time():
+            self.solve_time = time.time()
+            return self.solve_time
+
+        solve_time()
+
+        return self.equilibrium_leaves, self.results_final, self.solve_time
+
+    #decode the solver output into the equilibrium paths
+    def decode(self):
         #save the output
         def output_cleaner():
-            self.output_text = open("{}-output.txt".format(self.game.title), "w")
-            self.output_text.write(self.stdout)
-            self.output_text.close()
-            #read output as text into a dataframe
-            self.outcome_df = pd.read_table("{}-output.txt".format(self.game.title), delim_whitespace=True, names=('Infoset','Action','Prob','Value', 'Final'))
-            #parse the output
-            self.stdout_strip = self.stdout.strip()
-            self.output_cleaned = self.stdout_strip.split('NE,')[1:]
-            self.output_cleaned  = [x.replace('\n', '') for x in self.output_cleaned]
-            self.output_cleaned = [out.split(',') for out in self.output_cleaned]
-            for i in range(len(self.output_cleaned)):
-                self.output_cleaned[i][:] = [int(x) for x in self.output_cleaned[i]]
-            return self.output_text, self.outcome_df, self.stdout_strip, self.output_cleaned
-        
-        output_cleaner()
-        
-        #redefine the infoset counter 
-        def infosetter_output():
-            self.num_infosets_out = 0
-            for x in range(1,self.num_players):
-                self.num_infosets_out += self.num_moves**x
-            return self.num_infosets_out
-        
-        #create list of  probability dictionaries for each equilibria
-        def prob_dict() :
-            self.prob_dict = []
-            for i in range(len(self.output_cleaned)) :
-                mid_dict = {}
-                for player in self.game.players:
-                    mid_dict.update({player.label : self.output_cleaned[i][infosetter_output() :infosetter_output() + self.num_moves**int(player.label[-1])]})
-                self.prob_dict.append(mid_dict)
-            return self.prob_dict
-        
-        prob_dict()
-    
-        #create probability list
-        def prob_list() :
-            self.prob_list = []
-            for prob in self.prob_dict:
-                for key in sorted(prob.keys()):
-                    for outcome, i in zip(prob[key], range(len(self.all_paths))):
-                        self.prob_list.append(prob[key])
-            self.prob_list = [list(x) for x in set(tuple(x) for x in self.prob_list)]
-            self.prob_list.sort(key  = len)
-            return self.prob_list
-    
-        prob_list()
-    
-        #create probability list by player
-        def player_prob_list() :
-            self.player_prob_list = []
-            for prob in self.prob_dict :
-                for key in sorted(prob.keys()):
-                    prob_prelim = []
-                    for pro in prob[key]:
-                        prob_prelim.append(pro)
-                    self.player_prob_list.append(prob_prelim)
-            self.player_prob_list =[self.player_prob_list[x:x+len(self.game.players)] for x in range(0, len(self.player_prob_list),len(self.game.players))]
-            return self.player_prob_list
-    
-        player_prob_list()
-
-        #reshape player probabilities into arrays for multiplication
-        def player_prob_arrays():
-            self.player_prob_arrays = []
-            for player in self.player_prob_list:
-                for play in player:
-                    self.player_prob_arrays.append(np.array(play).reshape(-1,1))
-            self.player_prob_arrays =[self.player_prob_arrays[x:x+len(self.game.players)] for x in range(0, len(self.player_prob_arrays),len(self.game.players))]                        
-            return self.player_prob_arrays
-
-        player_prob_arrays()
-
-        #create action list
-        def action_list():
-            self.action_list = []
-            for prob in self.prob_dict:
-                for key in sorted(prob.keys()):
-                    for outcome, i in zip(prob[key], range(len(self.all_paths))):
-                        self.action_list.append(int(self.terminal_nodes[i].prior_action.label))
-            return self.action_list
-    
-        action_list()
-
-        #create action dictionary
-        def action_dict():
-            self.action_dict = {}
-            for player in self.game.players :
-                if int(player.label[-1]) == 1:
-                    self.action_dict.update({player.label : self.action_list[0: self.num_moves**(int(player.label[-1])-1) *(int(player.label[-1])-1)+ self.num_moves**int(player.label[-1])]})
-                else:
-                    self.action_dict.update({player.label : self.action_list[self.num_moves**(int(player.label[-1])-1): self.num_moves**(int(player.label[-1])-1) + self.num_moves**(int(player.label[-1]))]})                
-            return self.action_dict
-    
-        action_dict()
-
-        #create action list by the players
-        def player_action_list():
-            self.player_action_list = []
-            for key in sorted(self.action_dict.keys()):
-                self.action_prelim = []
-                for action in self.action_dict[key]:
-                    self.action_prelim.append(action)
-                self.player_action_list.append(self.action_prelim)  
-            return self.player_action_list
-    
-        player_action_list()
-
-        #unpack each list
-        def player_action_list_cleaned():
-            self.player_action_list_cleaned = []
-            for i in range(len(self.player_prob_arrays)):
-                self.player_action_list_cleaned.append(self.player_action_list)
-            return self.player_action_list_cleaned
-        
-        player_action_list_cleaned()
-    
-        #reshape list into arrays for multiplication
-        def action_arrays():
-            self.action_arrays = []
-            for action in self.player_action_list_cleaned:
-                for act in action:
-                   self.action_arrays.append(np.array(act).reshape(-1,1))
-            self.action_arrays =[self.action_arrays[x:x+len(self.game.players)] for x in range(0, len(self.action_arrays),len(self.game.players))]
-            return self.action_arrays
-    
-        action_arrays()
-    
-        #get all the combinations of actions and probabilties that lead to equilibria
-        def results():
-            self.results =  np.multiply(self.player_prob_arrays, self.action_arrays)
-            return self.results
-        
-        results()
-
-        #convert the arrays of equilibria to lists
-        def results_cleaned():
-            self.results_cleaned = []
-            for result in self.results:
-                for res in result:
-                    self.results_cleaned.append(res.tolist())
-            return self.results_cleaned
-    
-        results_cleaned()
-
-        #unpack the list of equilibria
-        def results_unpacked():
-            self.results_unpacked =[]
-            for result in self.results_cleaned :
-                self.results_unpacked.append([int(x) for [x] in result])
-            self.results_unpacked =[self.results_unpacked[x:x+len(self.game.players)] for x in range(0, len(self.results_unpacked),len(self.game.players))]
-            return self.results_unpacked
-    
-        results_unpacked()
-                
-        #condense the probability lists for each player
-        def results_condensed():
-            self.results_condensed  = []
-            for res in self.results_unpacked:
-                for i in range(len(res)):
-                    rest = res[i]
-                    rest =[rest[x:x+self.num_moves] for x in range(0, len(rest),self.num_moves)]
-                    self.results_condensed .append(rest)
-            self.results_condensed  = [self.results_condensed [x:x+len(self.game.players)] for x in range(0, len(self.results_condensed ),len(self.game.players))]
-            return self.results_condensed
-    
-        results_condensed()
-
-        #get the true equilibria
-        def true_equilibria():
-            flatten = itertools.chain.from_iterable     
-            self.result_position = []
-            self.result_move = []
-            for i in range(len(self.results_condensed)):
-                self.condensed = self.results_condensed[i]
-                for j in range(len(self.condensed)):
-                    if j == 0:
-                        flat= list(flatten(self.condensed[j]))
-                        for k in range(len(flat)):
-                            if flat[k] != 0.0:
-                                self.result_position.append((k))
-                                self.result_move.append(flat[k])
-                    else:
-                        flat= list(flatten(self.condensed[j]))
-                        self.condensed_list = self.condensed[j][self.result_position[-1]]
-                        self.condensed_outcome = []
-                        for condense in self.condensed_list :
-                            if condense != 0.0:
-                                self.condensed_outcome.append(condense)
-                        for l in range(self.num_moves*self.result_position[-1],self.num_moves*self.result_position[-1]+self.num_moves):
-                            if flat[l] != 0.0:
-                             self.result_position.append((l))
-                             self.result_move.append(flat[l])        
-            self.result_move =  [self.result_move[x:x+len(self.game.players)] for x in range(0, len(self.result_move),len(self.game.players))]
-            self.results_final = [tuple(x) for x in set(tuple(x) for x in self.result_move)]
-            return self.result_move, self.results_final 
-    
-        true_equilibria()
-    
-        #make paths in to tuples to use as dictionary keys
-        def paths_tuple():
-            self.paths_tuple = [tuple(path) for path in self.all_paths]
-            return self.paths_tuple
+            if self.diskless:
+                self.output_text = None
+            else:
+                self.output_text = open("{}-output.txt".format(self.title), "w")
+                self.output_text.write(self.stdout)
+                self.output_text.close()
+            #one row per equilibrium, one column per infoset action
+            self.profiles = parse_profiles(self.stdout)
+            return self.output_text, self.profiles
         
-        paths_tuple()
-    
-        #create dictionary of the paths
-        def payoff_dict():
-            self.payoff_dict = {}
-            for path, payoff in zip(self.paths_tuple, self.outcomes):
-                self.payoff_dict.update({path:(payoff)})
-            return self.payoff_dict
-    
-        payoff_dict()
-    
-        #create list of the payoffs
-        def payoff_list():
-            self.payoff_list = []
-            for key in sorted(self.payoff_dict.keys()):
-                self.pay_prelim = []
-                for pay in self.payoff_dict[key]:
-                    self.pay_prelim.append(pay)
-                    self.payoff_list.append(self.pay_prelim)
-            return self.payoff_list
-    
-        payoff_list()
+        with self.stats.phase('read_output'):
+            output_cleaner()
+
+        #follow every equilibrium from the root in one pass over the profile matrix
+        def equilibrium_leaves():
+            self.equilibrium_leaves = decode_profiles(self.tree, self.profiles)
+            self.mixed_profiles = self.profiles[~pure_profiles(self.profiles)] if self.profiles.size else self.profiles
+            if len(self.mixed_profiles):
+                logging.warning('{} mixed equilibria are not single paths and are left out of the results, see mixed_profiles'.format(len(self.mixed_profiles)))
+            return self.equilibrium_leaves
+
+        with self.stats.phase('decode'):
+            equilibrium_leaves()
+
+        return self.output_text, self.profiles, self.equilibrium_leaves
+
+    #the saved solver output as a dataframe, only loading pandas when it is asked for
+    @property
+    def outcome_df(self):
+        if getattr(self, 'output_text', None) is None:
+            return None
+        return pd.read_table("{}-output.txt".format(self.title), delim_whitespace=True, names=('Infoset','Action','Prob','Value', 'Final'))
+
+    #parse for the ideal output format
+    def parse(self, verbose = True):
+        #native solvers, races and the cache hand back the equilibrium leaves directly
+        if self.equilibrium_leaves is None:
+            self.decode()
+
+        #get the distinct equilibrium paths
+        def results_final():
+            leaves = np.asarray(self.equilibrium_leaves, dtype=np.int64)
+            leaves = leaves[np.sort(np.unique(leaves, return_index=True)[1])]
+            self.results_final = [tuple(path) for path in self.tree.paths(leaves).tolist()]
+            self.equilibrium_leaves = leaves
+            return self.results_final
+
+        with self.stats.phase('results'):
+            results_final()
+
+        #remember the equilibria for the next time this game comes up
+        if self.cache_key is not None and not self.cache_hit and self.solved_by == self.solver:
+            self.cache.put(self.cache_key, self.equilibrium_leaves, getattr(self, 'game_value', None) if self.solver == 'alphabeta' else None)
                   
         #create action_payoff_list
         def action_payoff_list():
-            self.action_payoff_list = []
-            for action in self.results_final:
-                if action in self.payoff_dict.keys():
-                    self.action_payoff_list.append((action,self.payoff_dict[action]))
+            self.action_payoff_list = [(path, exact_payoffs(self.outcomes[leaf], self.scale)) for path, leaf in zip(self.results_final, self.equilibrium_leaves)]
             return self.action_payoff_list
     
-        action_payoff_list()
+        with self.stats.phase('payoff_lists'):
+            action_payoff_list()
     
         #create the list of outcomes
         def outcome_list() :
             self.outcome_list = []
-            for i in range(self.num_moves+1):
-                for j in range(len(self.action_payoff_list)):
-                    for act, pay in zip(self.action_payoff_list[j][0], self.action_payoff_list[j][1]):
-                        self.outcome_list.append('{} : {}'.format(act,round(float(pay),1)))
-            self.outcome_list = [self.outcome_list[x:x+len(self.game.players)] for x in range(0, len(self.outcome_list),len(self.game.players))]
-            self.outcome_list = [list(x) for x in set(tuple(x) for x in self.outcome_list)]
+            for actions, payoffs in self.action_payoff_list:
+                self.outcome_list.append(['{} : {}'.format(act,round(float(pay),1)) for act, pay in zip(actions, payoffs)])
             return self.outcome_list
 
-        outcome_list()
+        with self.stats.phase('payoff_lists'):
+            outcome_list()
         
         #runtime to parse the game
         def parse_time():
@@ -480,58 +1497,88 @@ class Parser:
         def output_printer():
         #check runtime to build the game
             print('')
-            print(self.efg)
+            if self.solver not in NATIVE_SOLVERS:
+                write_efg(self.tree, self.outcomes, sys.stdout, self.title, self.scale)
             for outcome in self.outcome_list:
                 for out, i in zip(outcome, range(len(self.outcome_list[0])*len(self.outcome_list))):
-                    if (i + 1) % (len(self.game.players)) == 0:
+                    if (i + 1) % (self.num_players) == 0:
                         print('Player {} chose {}'.format(i+1,out))
                         logging.info('Player {} chose {}'.format(i+1,out))
                         print('')
                     else:
                         print('Player {} chose {}'.format(i+1,out))
                         logging.info('Player {} chose {}'.format(i+1,out))
-        output_printer()
 
-        return self.output_text, self.outcome_df, self.stdout_strip, self.output_cleaned, self.prob_dict, self.prob_list, self.player_prob_list, self.player_prob_arrays, self.action_list, self.action_dict, self.player_action_list, self.player_action_list_cleaned, self.action_arrays, self.results, self.results_cleaned, self.results_unpacked, self.results_condensed, self.result_move, self.results_final , self.paths_tuple, self.payoff_dict, self.payoff_list, self.action_payoff_list, self.outcome_list, self.parse_time
+        if verbose:
+            with self.stats.phase('print'):
+                output_printer()
+
+        return self.results_final, self.action_payoff_list, self.outcome_list, self.parse_time
     
 #class for payoffparser
 class PayoffParser:
     
-    def __init__(self, text_file_name, solver = 'enumpureP',title= 'Game'):
-        self.game = gambit.Game.new_tree()
+    def __init__(self, text_file_name, solver = 'enumpureP',title= 'Game', diskless = False, cache = None, timeout = None, max_memory = None, numeric = 'exact', tolerance = 1e-9, stats = None):
         self.text_file_name = text_file_name
+        self.outcomes = []
         self.solver = solver
         self.title = title
+        #keep the efg and solver output off disk unless save_game() is called
+        self.diskless = diskless
+        #optional ResultCache shared between games
+        self.cache = cache
+        self.cache_hit = False
+        self.cache_key = None
+        #wall clock limit in seconds and address space limit in bytes for every solver run
+        self.timeout = timeout
+        self.max_memory = max_memory
+        self.solved_by = None
+        self.equilibrium_leaves = None
+        #payoffs are kept as given, as int64 over a common denominator, or as float64 compared within tolerance
+        self.numeric = numeric
+        self.tolerance = tolerance if numeric == 'float' else 0
+        self.scale = 1
+        #durations of every phase, see Stats
+        self.stats = stats if stats is not None else Stats()
+        #leaves changed by update_payoffs, and every node's backward induction survivors once there are any
+        self.dirty_leaves = set()
+        self.levels = None
+        self.flat_outs = None
+        self.tree = None
+        self._game = None
+
+    #the gambit game is only created when an export or a gambit solver needs it
+    @property
+    def game(self):
+        if self._game is None:
+            with self.stats.phase('gambit_tree'):
+                self._game, self.terminal_nodes = self.tree.to_gambit(self.title)
+            #gambit outcomes by payoff vector
+            self.interned_outcomes = {}
+            #carry over the payoffs once they are known
+            if len(self.outcomes):
+                self.assign_payoffs()
+        return self._game
 
     #preprocess the text file to be usable for parsing
     def preprocess(self):
-        
+
+        #stream the payoff file into an outcome array, finding the number of players and moves on the way
+        #a .npy payoff tensor is memory mapped instead of read
         def readfile():
-            self.text_file = pd.read_table(self.text_file_name, delim_whitespace=False, header = None)
-            self.text_file.columns = ['Outcomes']
-            return self.text_file
-        
-        readfile()
-        
-        #parse the text file
-        def simple_parser():
-            self.text_file_parsed = [outcome.split(':') for outcome in self.text_file['Outcomes']]
-            return self.text_file_parsed
-    
-        simple_parser()
-    
-        #find number of players and number of movesd
-        def get_moves_and_players():
-            self.num_players = len(self.text_file_parsed[0][0]) - 1
-            self.num_moves = int(len(self.text_file_parsed) / (self.num_players+1))
-            return self.num_players, self.num_moves
-    
-        get_moves_and_players()
+            if isinstance(self.text_file_name, str) and self.text_file_name.endswith('.npy'):
+                self.num_moves, self.num_players, self.outcomes = load_payoff_tensor(self.text_file_name)
+            else:
+                self.num_moves, self.num_players, self.outcomes = read_payoffs(self.text_file_name)
+            return self.outcomes
 
-        return self.text_file, self.text_file_parsed, self.num_players, self.num_moves
+        with self.stats.phase('read'):
+            readfile()
+
+        return self.outcomes, self.num_players, self.num_moves
         
     #build the game
-    def build(self):
+    def build(self, as_list = False):
         
         #get start time
         def start_time():
@@ -540,130 +1587,47 @@ class PayoffParser:
             return self.start_Time
         
         start_time()
-            
-        #make game title
-        def game_title():
-            self.game.title = self.title
-            return self.game.title
-            
-        game_title()
-
-        #add the player names
-        def add_players():
-            for i in range(self.num_players):
-                self.game.players.add('Player' + str(i + 1))
-            return self.game.players
-                
-        add_players()
-    
-        #define number of infosets
-        def infosetter():
-            self.num_infosets = 0
-            for x in range(self.num_players):
-                self.num_infosets += self.num_moves**x
-            return self.num_infosets
-    
-        #create the root node
-        def create_node() :
-            if len(self.game.infosets) == 0:
-                move = self.game.root.append_move(self.game.players[0],self.num_moves)
-                move.label = 'Player1'
-                for i in range(self.num_moves) :
-                    move.actions[i].label = str(i+1)
-    
-        create_node()
-    
-        #create all subsequent nodes
-        def create_subsequent_nodes() :
-            for info in self.game.infosets:
-                if len(self.game.infosets) < infosetter():
-                    for member in info.members:
-                        if member.is_terminal == False:
-                            for i in range(self.num_moves):
-                                move = member.children[i].append_move(self.game.players[member.player.number+1],self.num_moves)
-                                move.label = 'Player {} Chose {}'.format(member.player.number+1,i+1)
-                                for i in range(self.num_moves):
-                                    move.actions[i].label = str(i+1)
-                else:
-                    break
-    
-        create_subsequent_nodes()
-    
-        ##get all the terminal nodes
-        def get_terminal_nodes() :
-            self.terminal_nodes = []
-            for infoset in self.game.infosets:
-                if self.game.players[len(self.game.players)-1].label in infoset.player.label:
-                    for member in infoset.members:
-                        for i in range(len(member.children)):
-                            self.terminal_nodes.append(member.children[i])
-            return self.terminal_nodes
-    
-        get_terminal_nodes()
+
+        #lay out the tree without creating any gambit nodes
+        def make_tree():
+            self.tree = GameTree(self.num_moves, self.num_players)
+            self.num_infosets = self.tree.num_infosets
+            return self.tree
+
+        with self.stats.phase('tree'):
+            make_tree()
     
-        #get the paths
+        #get the paths as an (n_leaves, n_players) array, or as lists if asked for
+        #a memory mapped payoff tensor is meant to stay on disk, so it gets no paths
         def get_paths():
-            self.all_paths =[]
-            for i in range(len(self.terminal_nodes)):
-                prelim_paths =[]
-                while self.terminal_nodes[i].parent != None:
-                    prelim_paths.append(int(self.terminal_nodes[i].prior_action.label))
-                    self.terminal_nodes[i] = self.terminal_nodes[i].parent
-                self.all_paths.append(prelim_paths)
-            for path in self.all_paths:
-                path.reverse()
-    
+            if isinstance(self.outcomes, np.memmap):
+                self.all_paths = None
+                return self.all_paths
+            self.all_paths = self.tree.paths()
+            if as_list:
+                self.all_paths = self.all_paths.tolist()
             return self.all_paths
     
-        get_paths()
+        with self.stats.phase('paths'):
+            get_paths()
         
 
         #get the payoffs for each path
         def payoffs():
-            self.outcomes = [split[1].split(',') for split in self.text_file_parsed]
-            self.outcomes = [Fraction(out) for outcome in self.outcomes for out in outcome] 
-            self.outcomes =[self.outcomes[x:x+len(self.game.players)] for x in range(0, len(self.outcomes),len(self.game.players))]
-            
-            #get flattened outcomes for parsing
-            flatten = itertools.chain.from_iterable
-            self.flat_outs = list(flatten(self.outcomes))
+            self.outcomes, self.scale = numeric_outcomes(self.outcomes, self.numeric)
+            #get flattened outcomes for parsing, leaving a memory mapped tensor on disk
+            if isinstance(self.outcomes.base, np.memmap):
+                self.flat_outs = self.outcomes.ravel()
+            else:
+                self.flat_outs = self.outcomes.ravel().tolist()
             return self.outcomes,self.flat_outs
     
-        payoffs()
+        with self.stats.phase('outcomes'):
+            payoffs()
 
-        #reset the terminal nodes
-        def reset_terminal_nodes():
-            self.terminal_nodes = get_terminal_nodes()
-            return self.terminal_nodes
-    
-        reset_terminal_nodes()
-    
-        #assign the payoffs at each terminal node
-        def assign_payoffs():
-            self.assigned_outcomes = []
-            for i in range(len(self.outcomes)):
-                for j in range(self.num_moves):
-                    out = self.game.outcomes.add("{} chose {}".format(self.game.players[len(self.game.players)-1].label,j+1))
-                    self.assigned_outcomes.append(out)
-            for out, j in zip(self.assigned_outcomes, range(len(self.outcomes))):
-                for k in range(self.num_players):
-                    out[k] = self.outcomes[j][k]
-            for node, out in zip(self.terminal_nodes, self.assigned_outcomes):
-                for i in range(self.num_players):
-                    node.outcome = out
-            return self.assigned_outcomes, self.terminal_nodes
-    
-        assign_payoffs()
-    
-        #save the game to the efg format
-        def save_game():
-            self.efg = self.game.write('efg')
-            self.game_file = open("{}-output.efg".format(self.game.title), "w")
-            self.game_file.write(self.efg)
-            self.game_file.close()
-            return self.efg, self.game_file
-        
-        save_game()
+        #only the gambit solvers need the efg file
+        if self.solver not in NATIVE_SOLVERS and not self.diskless:
+            self.save_game()
         
         #runtime to build the game
         def game_time():
@@ -672,24 +1636,51 @@ class PayoffParser:
         
         game_time()
 
-        return self.start_Time, self.game.title, self.game.players, self.all_paths, self.flat_outs, self.assigned_outcomes, self.terminal_nodes, self.efg, self.game_file, self.game_time
-    
+        return self.start_Time, self.tree, self.all_paths, self.flat_outs, self.game_time
+
+    #assign the payoffs to the terminal nodes of the gambit game
+    def assign_payoffs(self):
+        with self.stats.phase('assign_outcomes'):
+            #creating the gambit tree also fills in the terminal nodes
+            players = self.game.players
+            #leaves with the same payoffs share one outcome, and outcomes already in the game are reused
+            self.assigned_outcomes = []
+            for j in range(len(self.outcomes)):
+                label = "{} chose {}".format(players[self.num_players-1].label, j % self.num_moves + 1)
+                out = intern_outcome(self.game, self.interned_outcomes, exact_payoffs(self.outcomes[j], self.scale), label)
+                self.assigned_outcomes.append(out)
+            for node, out in zip(self.terminal_nodes, self.assigned_outcomes):
+                node.outcome = out
+        return self.assigned_outcomes, self.terminal_nodes
+
+    #stream the game to the efg format without building it in gambit
+    def save_game(self):
+        self.game_file = open("{}-output.efg".format(self.title), "w", EFG_BUFFER_SIZE)
+        with self.stats.phase('efg_write'), self.game_file:
+            write_efg(self.tree, self.outcomes, self.game_file, self.title, self.scale)
+        return self.game_file
+
     #solve the game
     def solve(self):
+        #a game solved before comes straight from the cache
+        if self.lookup_cache():
+            return self.equilibrium_leaves, self.results_final, self.solve_time
+
+        #solve the game in process for the native solvers
+        self.solved_by = self.solver
+        if self.solver in NATIVE_SOLVERS:
+            return self.solve_native()
         
         #solve the game using the terminal
         def solve_external():
-            # can take value "enumpureP"
-            if self.solver == 'enumpureP':
-                self.command = ['gambit-' +self.solver[:-1], '-P']
-            else:
-                sys.exit('unknown solver')
-            self.command.append(self.game_file.name)
-            self.process = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            self.stdout, self.stderr = self.process.communicate()
+            self.equilibrium_leaves = None
+            self.command, self.process = start_solver(self)
+            self.stdout, self.stderr = communicate_within(self.process, self.timeout)
+            self.stats.count('stdout_bytes', len(self.stdout))
             return self.stdout,self.command, self.process, self.stderr
 
-        solve_external()
+        with self.stats.phase('solver'):
+            solve_external()
 
         #runtime to solve the game
         def solve_time():
@@ -700,260 +1691,179 @@ class PayoffParser:
 
         return self.stdout,self.command, self.process, self.stderr, self.solve_time
 
-    #parse for the ideal output format
-    def parse(self):
-        
+    #yield the equilibria one at a time as the solver prints them
+    def iter_equilibria(self, max_equilibria = None):
+        return iter_solver_equilibria(self, max_equilibria)
+
+    #change the payoffs of some leaves without building the game again, see update_game_payoffs
+    def update_payoffs(self, changes):
+        return update_game_payoffs(self, changes)
+
+    #the strategic form payoff tensor, in the units of the numeric backend, and its pure Nash equilibria
+    #as rows of strategy indices, see strategy_leaves for how strategies are numbered
+    def strategic_form(self):
+        self.strategic_payoffs = strategic_form_payoffs(self.num_moves, self.num_players, self.outcomes)
+        self.strategic_equilibria = strategic_pure_nash(self.strategic_payoffs, self.tolerance)
+        return self.strategic_payoffs, self.strategic_equilibria
+
+    #solve the game from an event loop, sharing the cap on running solvers
+    async def solve_async(self, timeout = None):
+        if self.lookup_cache():
+            return self.equilibrium_leaves, self.results_final, self.solve_time
+        self.solved_by = self.solver
+        if self.solver in NATIVE_SOLVERS:
+            #native solvers run in a worker thread so the event loop stays free, and past the timeout
+            #their forked child is killed like a solver process
+            async with solver_semaphore():
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(None, self.solve_native, timeout)
+                except subprocess.TimeoutExpired:
+                    raise asyncio.TimeoutError()
+        self.equilibrium_leaves = None
+        with self.stats.phase('solver'):
+            self.command, self.process, self.stdout, self.stderr = await run_solver_async(self, self.timeout if timeout is None else timeout)
+        self.stats.count('stdout_bytes', len(self.stdout))
+        self.solve_time = time.time()
+        return self.stdout,self.command, self.process, self.stderr, self.solve_time
+
+    #parse the game in a worker thread so the event loop stays free
+    async def parse_async(self, verbose = True):
+        return await asyncio.get_running_loop().run_in_executor(None, self.parse, verbose)
+
+    #run several solvers at once, keeping the first to find an equilibrium and killing the rest
+    def race(self, solvers):
+        def run_race():
+            self.solved_by, self.equilibrium_leaves = race_solvers(self, solvers)
+            self.results_final = [tuple(self.tree.path(leaf)) for leaf in self.equilibrium_leaves]
+            return self.solved_by, self.equilibrium_leaves, self.results_final
+
+        with self.stats.phase('solver'):
+            run_race()
+
+        #runtime to solve the game
+        def solve_time():
+            self.solve_time = time.time()
+            return self.solve_time
+
+        solve_time()
+
+        return self.solved_by, self.equilibrium_leaves, self.results_final, self.solve_time
+
+    #fill in the equilibria from the cache, if the game has been solved before
+    def lookup_cache(self):
+        self.cache_hit = False
+        self.cache_key = None
+        #hashing payoffs that are only evaluated on demand would evaluate every leaf, so they are not cached
+        if self.cache is not None and not isinstance(self.outcomes, LazyOutcomes):
+            self.cache_key = self.cache.key(self)
+            entry = self.cache.get(self.cache_key)
+            if entry is not None:
+                self.cache_hit = True
+                self.equilibrium_leaves = entry['leaves']
+                if entry.get('game_value') is not None:
+                    self.game_value = Fraction(entry['game_value'])
+                self.results_final = [tuple(self.tree.path(leaf)) for leaf in self.equilibrium_leaves]
+                self.solve_time = time.time()
+        return self.cache_hit
+
+    #solve the game without leaving the process
+    def solve_native(self, timeout = None):
+        timeout = self.timeout if timeout is None else timeout
+        def solve_backward():
+            if timeout is None and self.max_memory is None:
+                self.equilibrium_leaves = native_leaves(self)
+            else:
+                self.equilibrium_leaves = run_native_limited(self, timeout = timeout)
+            self.results_final = [tuple(self.tree.path(leaf)) for leaf in self.equilibrium_leaves]
+            return self.equilibrium_leaves, self.results_final
+
+        with self.stats.phase('solver'):
+            solve_backward()
+
+        #runtime to solve the game
+        def solve_time():
+            self.solve_time = time.time()
+            return self.solve_time
+
+        solve_time()
+
+        return self.equilibrium_leaves, self.results_final, self.solve_time
+
+    #decode the solver output into the equilibrium paths
+    def decode(self):
         #save the output
         def output_cleaner():
-            self.output_text = open("{}-output.txt".format(self.game.title), "w")
-            self.output_text.write(self.stdout)
-            self.output_text.close()
-            #read output as text into a dataframe
-            self.outcome_df = pd.read_table("{}-output.txt".format(self.game.title), delim_whitespace=True, names=('Infoset','Action','Prob','Value', 'Final'))
-            #parse the output
-            self.stdout_strip = self.stdout.strip()
-            self.output_cleaned = self.stdout_strip.split('NE,')[1:]
-            self.output_cleaned  = [x.replace('\n', '') for x in self.output_cleaned]
-            self.output_cleaned = [out.split(',') for out in self.output_cleaned]
-            for i in range(len(self.output_cleaned)):
-                self.output_cleaned[i][:] = [int(x) for x in self.output_cleaned[i]]
-            return self.output_text, self.outcome_df, self.stdout_strip, self.output_cleaned
-        
-        output_cleaner()
-        
-        #redefine the infoset counter 
-        def infosetter_output():
-            self.num_infosets_out = 0
-            for x in range(1,self.num_players):
-                self.num_infosets_out += self.num_moves**x
-            return self.num_infosets_out
-        
-        #create list of  probability dictionaries for each equilibria
-        def prob_dict() :
-            self.prob_dict = []
-            for i in range(len(self.output_cleaned)) :
-                mid_dict = {}
-                for player in self.game.players:
-                    mid_dict.update({player.label : self.output_cleaned[i][infosetter_output() :infosetter_output() + self.num_moves**int(player.label[-1])]})
-                self.prob_dict.append(mid_dict)
-            return self.prob_dict
-        
-        prob_dict()
-    
-        #create probability list
-        def prob_list() :
-            self.prob_list = []
-            for prob in self.prob_dict:
-                for key in sorted(prob.keys()):
-                    for outcome, i in zip(prob[key], range(len(self.all_paths))):
-                        self.prob_list.append(prob[key])
-            self.prob_list = [list(x) for x in set(tuple(x) for x in self.prob_list)]
-            self.prob_list.sort(key  = len)
-            return self.prob_list
-    
-        prob_list()
-    
-        #create probability list by player
-        def player_prob_list() :
-            self.player_prob_list = []
-            for prob in self.prob_dict :
-                for key in sorted(prob.keys()):
-                    prob_prelim = []
-                    for pro in prob[key]:
-                        prob_prelim.append(pro)
-                    self.player_prob_list.append(prob_prelim)
-            self.player_prob_list =[self.player_prob_list[x:x+len(self.game.players)] for x in range(0, len(self.player_prob_list),len(self.game.players))]
-            return self.player_prob_list
-    
-        player_prob_list()
-
-        #reshape player probabilities into arrays for multiplication
-        def player_prob_arrays():
-            self.player_prob_arrays = []
-            for player in self.player_prob_list:
-                for play in player:
-                    self.player_prob_arrays.append(np.array(play).reshape(-1,1))
-            self.player_prob_arrays =[self.player_prob_arrays[x:x+len(self.game.players)] for x in range(0, len(self.player_prob_arrays),len(self.game.players))]                        
-            return self.player_prob_arrays
-
-        player_prob_arrays()
-
-        #create action list
-        def action_list():
-            self.action_list = []
-            for prob in self.prob_dict:
-                for key in sorted(prob.keys()):
-                    for outcome, i in zip(prob[key], range(len(self.all_paths))):
-                        self.action_list.append(int(self.terminal_nodes[i].prior_action.label))
-            return self.action_list
-    
-        action_list()
-
-        #create action dictionary
-        def action_dict():
-            self.action_dict = {}
-            for player in self.game.players :
-                if int(player.label[-1]) == 1:
-                    self.action_dict.update({player.label : self.action_list[0: self.num_moves**(int(player.label[-1])-1) *(int(player.label[-1])-1)+ self.num_moves**int(player.label[-1])]})
-                else:
-                    self.action_dict.update({player.label : self.action_list[self.num_moves**(int(player.label[-1])-1): self.num_moves**(int(player.label[-1])-1) + self.num_moves**(int(player.label[-1]))]})                
-            return self.action_dict
-    
-        action_dict()
-
-        #create action list by the players
-        def player_action_list():
-            self.player_action_list = []
-            for key in sorted(self.action_dict.keys()):
-                self.action_prelim = []
-                for action in self.action_dict[key]:
-                    self.action_prelim.append(action)
-                self.player_action_list.append(self.action_prelim)  
-            return self.player_action_list
-    
-        player_action_list()
-
-        #unpack each list
-        def player_action_list_cleaned():
-            self.player_action_list_cleaned = []
-            for i in range(len(self.player_prob_arrays)):
-                self.player_action_list_cleaned.append(self.player_action_list)
-            return self.player_action_list_cleaned
-        
-        player_action_list_cleaned()
-    
-        #reshape list into arrays for multiplication
-        def action_arrays():
-            self.action_arrays = []
-            for action in self.player_action_list_cleaned:
-                for act in action:
-                   self.action_arrays.append(np.array(act).reshape(-1,1))
-            self.action_arrays =[self.action_arrays[x:x+len(self.game.players)] for x in range(0, len(self.action_arrays),len(self.game.players))]
-            return self.action_arrays
-    
-        action_arrays()
-    
-        #get all the combinations of actions and probabilties that lead to equilibria
-        def results():
-            self.results =  np.multiply(self.player_prob_arrays, self.action_arrays)
-            return self.results
-        
-        results()
-
-        #convert the arrays of equilibria to lists
-        def results_cleaned():
-            self.results_cleaned = []
-            for result in self.results:
-                for res in result:
-                    self.results_cleaned.append(res.tolist())
-            return self.results_cleaned
-    
-        results_cleaned()
-
-        #unpack the list of equilibria
-        def results_unpacked():
-            self.results_unpacked =[]
-            for result in self.results_cleaned :
-                self.results_unpacked.append([int(x) for [x] in result])
-            self.results_unpacked =[self.results_unpacked[x:x+len(self.game.players)] for x in range(0, len(self.results_unpacked),len(self.game.players))]
-            return self.results_unpacked
-    
-        results_unpacked()
-                
-        #condense the probability lists for each player
-        def results_condensed():
-            self.results_condensed  = []
-            for res in self.results_unpacked:
-                for i in range(len(res)):
-                    rest = res[i]
-                    rest =[rest[x:x+self.num_moves] for x in range(0, len(rest),self.num_moves)]
-                    self.results_condensed .append(rest)
-            self.results_condensed  = [self.results_condensed [x:x+len(self.game.players)] for x in range(0, len(self.results_condensed ),len(self.game.players))]
-            return self.results_condensed
-    
-        results_condensed()
-
-        #get the true equilibria
-        def true_equilibria():
-            flatten = itertools.chain.from_iterable     
-            self.result_position = []
-            self.result_move = []
-            for i in range(len(self.results_condensed)):
-                self.condensed = self.results_condensed[i]
-                for j in range(len(self.condensed)):
-                    if j == 0:
-                        flat= list(flatten(self.condensed[j]))
-                        for k in range(len(flat)):
-                            if flat[k] != 0.0:
-                                self.result_position.append((k))
-                                self.result_move.append(flat[k])
-                    else:
-                        flat= list(flatten(self.condensed[j]))
-                        self.condensed_list = self.condensed[j][self.result_position[-1]]
-                        self.condensed_outcome = []
-                        for condense in self.condensed_list :
-                            if condense != 0.0:
-                                self.condensed_outcome.append(condense)
-                        for l in range(self.num_moves*self.result_position[-1],self.num_moves*self.result_position[-1]+self.num_moves):
-                            if flat[l] != 0.0:
-                             self.result_position.append((l))
-                             self.result_move.append(flat[l])        
-            self.result_move =  [self.result_move[x:x+len(self.game.players)] for x in range(0, len(self.result_move),len(self.game.players))]
-            self.results_final = [tuple(x) for x in set(tuple(x) for x in self.result_move)]
-            return self.result_move, self.results_final 
-    
-        true_equilibria()
-    
-        #make paths in to tuples to use as dictionary keys
-        def paths_tuple():
-            self.paths_tuple = [tuple(path) for path in self.all_paths]
-            return self.paths_tuple
+            if self.diskless:
+                self.output_text = None
+            else:
+                self.output_text = open("{}-output.txt".format(self.title), "w")
+                self.output_text.write(self.stdout)
+                self.output_text.close()
+            #one row per equilibrium, one column per infoset action
+            self.profiles = parse_profiles(self.stdout)
+            return self.output_text, self.profiles
         
-        paths_tuple()
-    
-        #create dictionary of the paths
-        def payoff_dict():
-            self.payoff_dict = {}
-            for path, payoff in zip(self.paths_tuple, self.outcomes):
-                self.payoff_dict.update({path:(payoff)})
-            return self.payoff_dict
-    
-        payoff_dict()
-    
-        #create list of the payoffs
-        def payoff_list():
-            self.payoff_list = []
-            for key in sorted(self.payoff_dict.keys()):
-                self.pay_prelim = []
-                for pay in self.payoff_dict[key]:
-                    self.pay_prelim.append(pay)
-                    self.payoff_list.append(self.pay_prelim)
-            return self.payoff_list
-    
-        payoff_list()
+        with self.stats.phase('read_output'):
+            output_cleaner()
+
+        #follow every equilibrium from the root in one pass over the profile matrix
+        def equilibrium_leaves():
+            self.equilibrium_leaves = decode_profiles(self.tree, self.profiles)
+            self.mixed_profiles = self.profiles[~pure_profiles(self.profiles)] if self.profiles.size else self.profiles
+            if len(self.mixed_profiles):
+                logging.warning('{} mixed equilibria are not single paths and are left out of the results, see mixed_profiles'.format(len(self.mixed_profiles)))
+            return self.equilibrium_leaves
+
+        with self.stats.phase('decode'):
+            equilibrium_leaves()
+
+        return self.output_text, self.profiles, self.equilibrium_leaves
+
+    #the saved solver output as a dataframe, only loading pandas when it is asked for
+    @property
+    def outcome_df(self):
+        if getattr(self, 'output_text', None) is None:
+            return None
+        return pd.read_table("{}-output.txt".format(self.title), delim_whitespace=True, names=('Infoset','Action','Prob','Value', 'Final'))
+
+    #parse for the ideal output format
+    def parse(self, verbose = True):
+        #native solvers, races and the cache hand back the equilibrium leaves directly
+        if self.equilibrium_leaves is None:
+            self.decode()
+
+        #get the distinct equilibrium paths
+        def results_final():
+            leaves = np.asarray(self.equilibrium_leaves, dtype=np.int64)
+            leaves = leaves[np.sort(np.unique(leaves, return_index=True)[1])]
+            self.results_final = [tuple(path) for path in self.tree.paths(leaves).tolist()]
+            self.equilibrium_leaves = leaves
+            return self.results_final
+
+        with self.stats.phase('results'):
+            results_final()
+
+        #remember the equilibria for the next time this game comes up
+        if self.cache_key is not None and not self.cache_hit and self.solved_by == self.solver:
+            self.cache.put(self.cache_key, self.equilibrium_leaves, getattr(self, 'game_value', None) if self.solver == 'alphabeta' else None)
                   
         #create action_payoff_list
         def action_payoff_list():
-            self.action_payoff_list = []
-            for action in self.results_final:
-                if action in self.payoff_dict.keys():
-                    self.action_payoff_list.append((action,self.payoff_dict[action]))
+            self.action_payoff_list = [(path, exact_payoffs(self.outcomes[leaf], self.scale)) for path, leaf in zip(self.results_final, self.equilibrium_leaves)]
             return self.action_payoff_list
     
-        action_payoff_list()
+        with self.stats.phase('payoff_lists'):
+            action_payoff_list()
     
         #create the list of outcomes
         def outcome_list() :
             self.outcome_list = []
-            for i in range(self.num_moves+1):
-                for j in range(len(self.action_payoff_list)):
-                    for act, pay in zip(self.action_payoff_list[j][0], self.action_payoff_list[j][1]):
-                        self.outcome_list.append('{} : {}'.format(act,round(float(pay),1)))
-            self.outcome_list = [self.outcome_list[x:x+len(self.game.players)] for x in range(0, len(self.outcome_list),len(self.game.players))]
-            self.outcome_list = [list(x) for x in set(tuple(x) for x in self.outcome_list)]
+            for actions, payoffs in self.action_payoff_list:
+                self.outcome_list.append(['{} : {}'.format(act,round(float(pay),1)) for act, pay in zip(actions, payoffs)])
             return self.outcome_list
 
-        outcome_list()
+        with self.stats.phase('payoff_lists'):
+            outcome_list()
         
         #runtime to parse the game
         def parse_time():
@@ -966,16 +1876,98 @@ class PayoffParser:
         def output_printer():
         #check runtime to build the game
             print('')
-            print(self.efg)
+            if self.solver not in NATIVE_SOLVERS:
+                write_efg(self.tree, self.outcomes, sys.stdout, self.title, self.scale)
             for outcome in self.outcome_list:
                 for out, i in zip(outcome, range(len(self.outcome_list[0])*len(self.outcome_list))):
-                    if (i + 1) % (len(self.game.players)) == 0:
+                    if (i + 1) % (self.num_players) == 0:
                         print('Player {} chose {}'.format(i+1,out))
                         logging.info('Player {} chose {}'.format(i+1,out))
                         print('')
                     else:
                         print('Player {} chose {}'.format(i+1,out))
                         logging.info('Player {} chose {}'.format(i+1,out))
-        output_printer()
 
-        return self.output_text, self.outcome_df, self.stdout_strip, self.output_cleaned, self.prob_dict, self.prob_list, self.player_prob_list, self.player_prob_arrays, self.action_list, self.action_dict, self.player_action_list, self.player_action_list_cleaned, self.action_arrays, self.results, self.results_cleaned, self.results_unpacked, self.results_condensed, self.result_move, self.results_final , self.paths_tuple, self.payoff_dict, self.payoff_list, self.action_payoff_list, self.outcome_list, self.parse_time
+        if verbose:
+            with self.stats.phase('print'):
+                output_printer()
+
+        return self.results_final, self.action_payoff_list, self.outcome_list, self.parse_time
+
+#most solver processes that the async api runs at once, shared by every parser
+MAX_CONCURRENT_SOLVERS = os.cpu_count()
+solver_semaphores = weakref.WeakKeyDictionary()
+
+#the shared semaphore for the running event loop
+def solver_semaphore():
+    loop = asyncio.get_running_loop()
+    if loop not in solver_semaphores:
+        solver_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_SOLVERS)
+    return solver_semaphores[loop]
+
+#run the gambit solver as an asyncio subprocess, killing it if it outlives the timeout
+async def run_solver_async(game, timeout = None):
+    command = solver_command(game.solver)
+    limits = memory_limiter(game.max_memory)
+    async with solver_semaphore():
+        if game.diskless:
+            process = await asyncio.create_subprocess_exec(*command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, preexec_fn=limits)
+        else:
+            command.append(game.game_file.name)
+            process = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, preexec_fn=limits)
+
+        async def communicate():
+            if game.diskless:
+                try:
+                    for line in efg_lines(game.tree, game.outcomes, game.title, game.scale):
+                        process.stdin.write(line.encode())
+                        if process.stdin.transport.get_write_buffer_size() > EFG_BUFFER_SIZE:
+                            await process.stdin.drain()
+                    await process.stdin.drain()
+                    process.stdin.close()
+                except IOError:
+                    #the solver quit early, its stderr says why
+                    pass
+            return await process.communicate()
+
+        try:
+            stdout, stderr = await asyncio.wait_for(communicate(), timeout)
+        except asyncio.TimeoutError:
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+            raise
+    return command, process, stdout.decode(), stderr.decode()
+
+#build, solve and parse one game, handing back the error instead of raising it
+def run_game(game):
+    #games in a sweep often share a title, so their files would overwrite each other in the shared directory
+    game.diskless = True
+    try:
+        if isinstance(game, PayoffParser):
+            game.preprocess()
+            game.build()
+        else:
+            game.build()
+            game.payoffs()
+        game.solve()
+        return game.parse(verbose = False)
+    except (Exception, SystemExit) as error:
+        return error
+
+#solve many games across a process pool, returning the results of parse() in submission order
+#a game that fails gets its exception in its place instead of stopping the others
+def solve_many(games, workers = None):
+    pool = multiprocessing.Pool(workers)
+    #one task per game, so a game that cannot be pickled only fails its own slot
+    def result(pending):
+        try:
+            return pending.get()
+        except Exception as error:
+            return error
+
+    try:
+        return [result(pending) for pending in [pool.apply_async(run_game, (game,)) for game in games]]
+    finally:
+        pool.close()
+        pool.join()
@@ -0,0 +1,53 @@
+import collections
+import itertools
+
+import numpy as np
+
+#every pure strategy profile, where player d picks an action at each of their num_moves**d nodes
+def profiles(num_moves, num_players):
+    strategies = [list(itertools.product(range(num_moves), repeat = num_moves**depth)) for depth in range(num_players)]
+    return itertools.product(*strategies)
+
+#leaf reached from a node of depth and index when everyone plays the profile
+def play(num_moves, num_players, profile, depth = 0, index = 0):
+    for player in range(depth, num_players):
+        index = index * num_moves + profile[player][index]
+    return index
+
+#how many pure Nash equilibrium profiles reach each leaf
+def brute_force_nash(num_moves, num_players, outcomes):
+    found = collections.Counter()
+    for profile in profiles(num_moves, num_players):
+        leaf = play(num_moves, num_players, profile)
+        stable = True
+        for player in range(num_players):
+            for deviation in itertools.product(range(num_moves), repeat = num_moves**player):
+                changed = profile[:player] + (deviation,) + profile[player + 1:]
+                if outcomes[play(num_moves, num_players, changed)][player] > outcomes[leaf][player]:
+                    stable = False
+        if stable:
+            found[leaf] += 1
+    return found
+
+#by the one shot deviation principle a profile is subgame perfect when no mover gains by changing one action
+def brute_force_subgame_perfect(num_moves, num_players, outcomes):
+    found = set()
+    for profile in profiles(num_moves, num_players):
+        perfect = True
+        for depth in range(num_players):
+            for index in range(num_moves**depth):
+                payoff = outcomes[play(num_moves, num_players, profile, depth, index)][depth]
+                for action in range(num_moves):
+                    after = play(num_moves, num_players, profile, depth + 1, index * num_moves + action)
+                    if outcomes[after][depth] > payoff:
+                        perfect = False
+        if perfect:
+            found.add(play(num_moves, num_players, profile))
+    return found
+
+#small random games with small payoffs, so that ties come up often
+def random_games(sizes = ((2, 2), (3, 2), (2, 3)), count = 15, seed = 1):
+    rng = np.random.RandomState(seed)
+    for num_moves, num_players in sizes:
+        for _ in range(count):
+            yield num_moves, num_players, rng.randint(0, 3, size = (num_moves**num_players, num_players))
@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#run the tests against the module in src
+sys.path.insert(0, os.path.join(HERE, os.pardir, 'src'))
+
+#put the stand-in gambit-enumpure of the benchmarks on the path and run in an empty directory,
+#so the gambit solver paths can be tested without gambit and the files they write can be checked
+@pytest.fixture
+def fake_gambit(monkeypatch, tmp_path):
+    monkeypatch.setenv('PATH', os.path.join(HERE, os.pardir, 'benchmarks', 'bin') + os.pathsep + os.environ['PATH'])
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,51 @@
+import itertools
+
+import numpy as np
+
+import gambitparser
+from brute_force import brute_force_subgame_perfect
+
+#player1 maximizes and player2 minimizes player1's payoff, every leaf visited
+def minimax(num_moves, num_players, outcomes, depth = 0, index = 0):
+    if depth == num_players:
+        return outcomes[index][0]
+    values = [minimax(num_moves, num_players, outcomes, depth + 1, index * num_moves + action) for action in range(num_moves)]
+    return max(values) if depth % 2 == 0 else min(values)
+
+def test_alphabeta_value_matches_minimax():
+    rng = np.random.RandomState(0)
+    for num_moves, num_players in itertools.product([2, 3], [2, 3]):
+        for _ in range(10):
+            values = rng.randint(-5, 6, size = num_moves**num_players)
+            outcomes = np.stack([values, -values], axis = 1)
+            if num_players == 3:
+                outcomes = np.stack([values, -values, values], axis = 1)
+            tree = gambitparser.GameTree(num_moves, num_players)
+            value, leaf = gambitparser.alphabeta(tree, outcomes, zero_sum = True)
+            assert value == minimax(num_moves, num_players, outcomes)
+            assert outcomes[leaf][0] == value
+
+def test_deep_tree_is_never_enumerated():
+    evaluated = []
+    def payoffs(paths):
+        evaluated.append(len(paths))
+        return (paths[:, 1:2] - paths[:, :1]) * [[1, -1]]
+    parser = gambitparser.Parser(100, 2, solver = 'alphabeta', payoff_function = payoffs)
+    parser.build()
+    parser.payoffs()
+    parser.solve()
+    assert parser.all_paths is None
+    assert parser.game_value == 0
+    assert sum(evaluated) < 1000
+
+def test_alphabeta_value_is_the_subgame_perfect_value():
+    rng = np.random.RandomState(2)
+    for num_moves in (2, 3):
+        for _ in range(20):
+            values = rng.randint(-3, 4, size = num_moves**2)
+            outcomes = np.stack([values, -values], axis = 1)
+            value, leaf = gambitparser.alphabeta(gambitparser.GameTree(num_moves, 2), outcomes)
+            subgame_perfect = brute_force_subgame_perfect(num_moves, 2, outcomes)
+            #in a zero-sum game every subgame perfect outcome has the game value
+            assert {outcomes[leaf][0] for leaf in subgame_perfect} == {value}
+            assert leaf in subgame_perfect
@@ -0,0 +1,58 @@
+import itertools
+from math import comb
+
+import numpy as np
+import pytest
+
+import gambitparser
+
+SIZES = [(2, 2), (2, 3), (3, 2), (3, 3), (2, 4)]
+
+#a random count table, with small payoffs so that ties come up often
+def random_count_payoffs(seed):
+    rng = np.random.RandomState(seed)
+    table = {}
+    def count_payoffs(counts):
+        if counts not in table:
+            table[counts] = rng.randint(0, 3, size = len(counts)).tolist()
+        return table[counts]
+    return count_payoffs
+
+def counts_of(path, num_moves):
+    return tuple(path.count(action) for action in range(1, num_moves + 1))
+
+@pytest.mark.parametrize('num_moves, num_players', SIZES)
+def test_table_has_one_row_per_split_of_the_players(num_moves, num_players):
+    table = gambitparser.anonymous_table(num_moves, num_players, random_count_payoffs(0))
+    assert len(table) == comb(num_moves + num_players - 1, num_players)
+    assert all(sum(counts) == num_players and len(counts) == num_moves for counts in table)
+
+@pytest.mark.parametrize('num_moves, num_players', SIZES)
+def test_outcomes_look_up_each_players_action(num_moves, num_players):
+    table = gambitparser.anonymous_table(num_moves, num_players, random_count_payoffs(1))
+    tree = gambitparser.GameTree(num_moves, num_players)
+    outcomes = gambitparser.anonymous_outcomes(tree, table)
+    for leaf, path in enumerate(itertools.product(range(1, num_moves + 1), repeat = num_players)):
+        row = table[counts_of(path, num_moves)]
+        assert outcomes[leaf].tolist() == [row[action - 1] for action in path]
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('num_moves, num_players', SIZES)
+def test_anonymous_backward_induction_matches_backward_induction(seed, num_moves, num_players):
+    table = gambitparser.anonymous_table(num_moves, num_players, random_count_payoffs(seed))
+    outcomes = gambitparser.anonymous_outcomes(gambitparser.GameTree(num_moves, num_players), table)
+    expected = gambitparser.backward_induction(num_moves, num_players, outcomes.tolist())
+    assert sorted(gambitparser.anonymous_backward_induction(num_moves, num_players, table)) == sorted(expected)
+
+def test_parser_with_count_payoffs():
+    count_payoffs = random_count_payoffs(3)
+    parser = gambitparser.Parser(3, 3, solver = 'backward', count_payoffs = count_payoffs)
+    parser.build()
+    parser.payoffs()
+    expected_outcomes = [[count_payoffs(counts_of(path, 3))[action - 1] for action in path]
+                         for path in itertools.product(range(1, 4), repeat = 3)]
+    assert np.asarray(parser.outcomes).tolist() == expected_outcomes
+    leaves = parser.solve()[0]
+    assert sorted(leaves) == sorted(gambitparser.backward_induction(3, 3, expected_outcomes))
+    paths = parser.parse(verbose = False)[0]
+    assert sorted(paths) == sorted(tuple(parser.tree.path(leaf)) for leaf in leaves)
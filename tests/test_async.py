@@ -0,0 +1,48 @@
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+
+import gambitparser
+
+def slow_first_leaf(num_moves, num_players, outcomes):
+    time.sleep(0.5)
+    slow_first_leaf.finished = time.perf_counter()
+    return [0]
+
+def test_native_solve_does_not_block_the_event_loop():
+    gambitparser.register_solver('slow_first', function = slow_first_leaf)
+    parser = gambitparser.Parser(2, 2, [[1, 2], [3, 4], [5, 6], [7, 8]], solver = 'slow_first')
+    parser.build()
+    parser.payoffs()
+    ticks = []
+
+    async def tick():
+        for _ in range(5):
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.05)
+
+    async def main():
+        return await asyncio.gather(parser.solve_async(), tick())
+
+    leaves, _ = asyncio.run(main())
+    assert leaves[0] == [0]
+    #the loop kept ticking while the solver slept
+    assert len(ticks) == 5
+    assert ticks[-1] < slow_first_leaf.finished
+
+def sleepy_first_leaf(num_moves, num_players, outcomes):
+    time.sleep(30)
+    return [0]
+
+def test_native_solve_is_killed_at_the_call_timeout():
+    gambitparser.register_solver('sleepy_first', function = sleepy_first_leaf)
+    parser = gambitparser.Parser(2, 2, [[1, 2], [3, 4], [5, 6], [7, 8]], solver = 'sleepy_first')
+    parser.build()
+    parser.payoffs()
+    start = time.perf_counter()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(parser.solve_async(timeout = 0.5))
+    assert time.perf_counter() - start < 10
+    assert multiprocessing.active_children() == []
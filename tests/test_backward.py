@@ -0,0 +1,20 @@
+import pytest
+
+import gambitparser
+from brute_force import brute_force_subgame_perfect, random_games
+
+@pytest.mark.parametrize('num_moves, num_players, outcomes', random_games())
+def test_backward_induction_finds_every_subgame_perfect_outcome(num_moves, num_players, outcomes):
+    expected = brute_force_subgame_perfect(num_moves, num_players, outcomes)
+    leaves = gambitparser.backward_induction(num_moves, num_players, outcomes.tolist())
+    assert len(leaves) == len(set(leaves))
+    assert set(leaves) == expected
+
+def test_parser_agrees_with_brute_force():
+    for num_moves, num_players, outcomes in random_games():
+        parser = gambitparser.Parser(num_moves, num_players, outcomes.tolist(), solver = 'backward')
+        parser.build()
+        parser.payoffs()
+        leaves, paths, _ = parser.solve()
+        assert set(leaves) == brute_force_subgame_perfect(num_moves, num_players, outcomes)
+        assert paths == [tuple(parser.tree.path(leaf)) for leaf in leaves]
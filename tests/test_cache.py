@@ -0,0 +1,51 @@
+from fractions import Fraction
+
+import gambitparser
+
+def solve(cache, solver, outcomes, **options):
+    parser = gambitparser.Parser(2, 2, outcomes, solver = solver, cache = cache, **options)
+    parser.build()
+    parser.payoffs()
+    parser.solve()
+    parser.parse(verbose = False)
+    return parser
+
+def test_cache_hit_returns_the_same_equilibria(tmp_path):
+    cache = gambitparser.ResultCache(str(tmp_path))
+    first = solve(cache, 'backward', [[1, 2], [3, 4], [5, 6], [7, 8]])
+    second = solve(cache, 'backward', [[1, 2], [3, 4], [5, 6], [7, 8]])
+    assert not first.cache_hit and second.cache_hit
+    assert second.results_final == first.results_final == [(2, 2)]
+
+def test_cache_hit_restores_the_game_value(tmp_path):
+    cache = gambitparser.ResultCache(str(tmp_path))
+    outcomes = [[Fraction(1, 2), -Fraction(1, 2)], [3, -3], [5, -5], [7, -7]]
+    first = solve(cache, 'alphabeta', outcomes)
+    second = solve(cache, 'alphabeta', outcomes)
+    assert second.cache_hit
+    assert second.game_value == first.game_value == 5
+
+def test_different_payoffs_miss(tmp_path):
+    cache = gambitparser.ResultCache(str(tmp_path))
+    solve(cache, 'backward', [[1, 2], [3, 4], [5, 6], [7, 8]])
+    assert not solve(cache, 'backward', [[1, 2], [3, 4], [5, 6], [7, 9]]).cache_hit
+
+def test_eviction_keeps_the_cache_under_its_cap(tmp_path):
+    cache = gambitparser.ResultCache(str(tmp_path), max_bytes = 100)
+    for value in range(10):
+        solve(cache, 'backward', [[value, 2], [3, 4], [5, 6], [7, 8]])
+    assert sum(path.stat().st_size for path in tmp_path.glob('*.json')) <= 100
+
+def test_lazy_payoffs_are_not_hashed(tmp_path):
+    evaluated = []
+    def payoffs(paths):
+        evaluated.append(len(paths))
+        return (paths[:, 1:] - paths[:, :1]) * [[1, -1]]
+    cache = gambitparser.ResultCache(str(tmp_path))
+    parser = gambitparser.Parser(20, 2, solver = 'alphabeta', payoff_function = payoffs, cache = cache)
+    parser.build()
+    parser.payoffs()
+    parser.solve()
+    parser.parse(verbose = False)
+    assert not parser.cache_hit and parser.cache_key is None
+    assert sum(evaluated) < 100
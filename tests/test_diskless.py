@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import gambitparser
+
+#distinct payoffs for every player, so the game has a single subgame perfect equilibrium
+def random_outcomes(num_moves, num_players, seed = 0):
+    rng = np.random.RandomState(seed)
+    return np.stack([rng.permutation(num_moves**num_players) for _ in range(num_players)], axis = 1).tolist()
+
+def subgame_perfect_paths(num_moves, num_players, outcomes):
+    tree = gambitparser.GameTree(num_moves, num_players)
+    return [tuple(tree.path(leaf)) for leaf in gambitparser.backward_induction(num_moves, num_players, outcomes)]
+
+@pytest.mark.parametrize('diskless', [True, False])
+def test_parser_solves_through_the_gambit_solver(fake_gambit, diskless):
+    outcomes = random_outcomes(3, 3)
+    parser = gambitparser.Parser(3, 3, outcomes, diskless = diskless)
+    parser.build()
+    parser.payoffs()
+    parser.solve()
+    assert parser.parse(verbose = False)[0] == subgame_perfect_paths(3, 3, outcomes)
+    written = sorted(path.name for path in fake_gambit.iterdir())
+    assert written == ([] if diskless else ['Game-output.efg', 'Game-output.txt'])
+
+@pytest.mark.parametrize('diskless', [True, False])
+def test_payoff_parser_solves_through_the_gambit_solver(fake_gambit, diskless):
+    outcomes = random_outcomes(4, 2, seed = 1)
+    tree = gambitparser.GameTree(4, 2)
+    with open('payoffs.txt', 'w') as text_file:
+        for leaf, payoff in enumerate(outcomes):
+            text_file.write('{}:{}\n'.format(','.join(map(str, tree.path(leaf))), ','.join(map(str, payoff))))
+    parser = gambitparser.PayoffParser('payoffs.txt', diskless = diskless, title = 'Payoffs')
+    parser.preprocess()
+    parser.build()
+    parser.solve()
+    assert parser.parse(verbose = False)[0] == subgame_perfect_paths(4, 2, outcomes)
+    assert (fake_gambit / 'Payoffs-output.efg').exists() != diskless
+
+def test_save_game_writes_a_diskless_game_on_request(fake_gambit):
+    parser = gambitparser.Parser(2, 2, [[1, 2], [3, 4], [5, 6], [7, 8]], diskless = True)
+    parser.build()
+    parser.payoffs()
+    assert list(fake_gambit.iterdir()) == []
+    parser.save_game()
+    with open('Game-output.efg') as efg_file:
+        assert efg_file.read() == ''.join(gambitparser.efg_lines(parser.tree, parser.outcomes))
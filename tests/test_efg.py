@@ -0,0 +1,55 @@
+import io
+import itertools
+import os
+
+import gambitparser
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), 'payoff-parser-examples')
+
+#payoffs of every terminal node in order, following references to earlier outcomes by number
+def terminal_payoffs(lines):
+    outcomes, payoffs = {}, []
+    for line in lines:
+        if not line.startswith('t '):
+            continue
+        fields = line.split(None, 3)
+        number = int(fields[2])
+        if '{' in line:
+            outcomes[number] = line[line.index('{') + 1:line.rindex('}')].strip()
+        payoffs.append(outcomes[number])
+    return payoffs
+
+def written(tree, outcomes, title = 'Game', scale = 1):
+    efg_file = io.StringIO()
+    gambitparser.write_efg(tree, outcomes, efg_file, title, scale)
+    return efg_file.getvalue().splitlines()
+
+def test_payoff_file_is_written_like_the_example():
+    num_moves, num_players, outcomes = gambitparser.read_payoffs(os.path.join(EXAMPLES, 'Game.txt'))
+    lines = written(gambitparser.GameTree(num_moves, num_players), outcomes)
+    with open(os.path.join(EXAMPLES, 'Game-output.efg')) as example:
+        expected = example.read().splitlines()
+    #the decision nodes are the same line for line, and the leaves have the same payoffs
+    assert [line for line in lines if not line.startswith('t ')] == [line for line in expected if not line.startswith('t ')]
+    assert terminal_payoffs(lines) == terminal_payoffs(expected)
+
+def test_title_quotes_are_escaped():
+    lines = written(gambitparser.GameTree(2, 1), [[1], [2]], title = 'say "hi"')
+    assert lines[0] == 'EFG 2 R "say \\"hi\\"" { "Player1" }'
+
+#payoffs made up on the spot, so a tree far too big for memory can be written
+class CountingOutcomes:
+    def __init__(self):
+        self.looked_up = 0
+    def __getitem__(self, leaf):
+        self.looked_up += 1
+        return [leaf, -leaf]
+
+def test_lines_are_streamed_without_building_the_file():
+    outcomes = CountingOutcomes()
+    lines = gambitparser.efg_lines(gambitparser.GameTree(10, 9), outcomes)
+    head = list(itertools.islice(lines, 12))
+    #the header, one decision node per level down the first branch, then the first leaves
+    assert [line.split()[0] for line in head[1:]] == ['p'] * 9 + ['t'] * 2
+    assert head[-1] == 't "" 2 "Player9 chose 2" { 1, -1 }\n'
+    assert outcomes.looked_up == 2
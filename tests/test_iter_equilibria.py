@@ -0,0 +1,56 @@
+import sys
+import time
+
+import numpy as np
+import pytest
+
+import gambitparser
+
+#prints two pure equilibria of a 2x2 game, leaves 0 and 3, then hangs until it is killed
+CHATTY = ['import sys, time',
+          'print("NE,1,0,1,0,0,1")',
+          'print("NE,0,1,1,0,0,1")',
+          'sys.stdout.flush()',
+          'time.sleep(30)']
+
+def built_game(solver, **options):
+    parser = gambitparser.Parser(2, 2, [[1, 1], [0, 0], [0, 0], [1, 1]], solver = solver, **options)
+    parser.build()
+    parser.payoffs()
+    return parser
+
+@pytest.mark.parametrize('solver', ['nash', 'strategic', 'backward'])
+def test_native_equilibria_match_parse(solver):
+    equilibria = list(built_game(solver).iter_equilibria())
+    parser = built_game(solver)
+    parser.solve()
+    paths, action_payoffs, _, _ = parser.parse(verbose = False)
+    #the strategic form reaches a leaf once per equilibrium profile, parse() keeps each path once
+    distinct = dict(equilibria)
+    assert list(distinct) == paths
+    assert all(type(action) is int for path in distinct for action in path)
+    assert [list(payoff) for payoff in distinct.values()] == [list(payoff) for _, payoff in action_payoffs]
+
+def test_native_equilibria_stop_at_max_equilibria():
+    assert [path for path, _ in built_game('nash').iter_equilibria(max_equilibria = 1)] == [(1, 1)]
+
+@pytest.mark.parametrize('diskless', [True, False])
+def test_solver_is_killed_after_max_equilibria(fake_gambit, diskless):
+    gambitparser.register_solver('chatty', command = [sys.executable, '-c', '; '.join(CHATTY)])
+    parser = built_game('chatty', diskless = diskless)
+    start = time.time()
+    equilibria = list(parser.iter_equilibria(max_equilibria = 1))
+    assert time.time() - start < 10
+    assert equilibria == [((1, 1), equilibria[0][1])]
+    assert type(equilibria[0][0][0]) is int
+    assert np.asarray(equilibria[0][1]).tolist() == [1, 1]
+
+def test_every_equilibrium_of_the_gambit_solver(fake_gambit):
+    parser = built_game('enumpureP', diskless = True)
+    equilibria = list(parser.iter_equilibria())
+    parser.solve()
+    assert [path for path, _ in equilibria] == parser.parse(verbose = False)[0]
+
+def test_zero_equilibria_never_starts_the_solver(fake_gambit):
+    gambitparser.register_solver('missing', command = ['no-such-gambit-solver'])
+    assert list(built_game('missing').iter_equilibria(max_equilibria = 0)) == []
@@ -0,0 +1,15 @@
+import numpy as np
+import pytest
+
+import gambitparser
+from brute_force import brute_force_nash, random_games
+
+@pytest.mark.parametrize('num_moves, num_players, outcomes', random_games())
+def test_pure_nash_finds_every_equilibrium_outcome(num_moves, num_players, outcomes):
+    expected = brute_force_nash(num_moves, num_players, outcomes)
+    assert set(gambitparser.pure_nash(num_moves, num_players, outcomes).tolist()) == set(expected)
+
+def test_float_payoffs_within_tolerance_are_ties():
+    outcomes = np.array([[1.0, 1.0], [1.0, 1.0 - 1e-12], [0.0, 0.0], [0.0, 0.0]])
+    assert gambitparser.pure_nash(2, 2, outcomes).tolist() == [0]
+    assert gambitparser.pure_nash(2, 2, outcomes, tolerance = 1e-9).tolist() == [0, 1]
@@ -0,0 +1,47 @@
+import io
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+import gambitparser
+
+RATIONAL = ['1/3', '1', '1/2', '0', '2', '2', '1/3', '1']
+
+def rational_outcomes():
+    return gambitparser.payoff_values(RATIONAL).reshape(4, 2)
+
+def test_exact_keeps_the_payoffs_as_given():
+    outcomes = rational_outcomes()
+    assert gambitparser.numeric_outcomes(outcomes, 'exact') == (outcomes, 1)
+
+def test_scaled_stores_int64_over_the_common_denominator():
+    outcomes, scale = gambitparser.numeric_outcomes(rational_outcomes(), 'scaled')
+    assert (outcomes.dtype, scale) == (np.int64, 6)
+    assert outcomes.tolist() == [[2, 6], [3, 0], [12, 12], [2, 6]]
+    assert gambitparser.exact_payoffs(outcomes[0], scale) == [Fraction(1, 3), 1]
+
+def test_float_stores_float64():
+    outcomes, scale = gambitparser.numeric_outcomes(rational_outcomes(), 'float')
+    assert (outcomes.dtype, scale) == (np.float64, 1)
+
+@pytest.mark.parametrize('outcomes, numeric', [([[1, 2]], 'decimal'), (np.array([[Fraction(2**62), Fraction(1, 3)]], dtype = object), 'scaled')])
+def test_bad_backends_and_overflow_are_refused(outcomes, numeric):
+    with pytest.raises(SystemExit):
+        gambitparser.numeric_outcomes(outcomes, numeric)
+
+def test_scaled_payoffs_are_written_exactly():
+    outcomes, scale = gambitparser.numeric_outcomes(rational_outcomes(), 'scaled')
+    efg_file = io.StringIO()
+    gambitparser.write_efg(gambitparser.GameTree(2, 2), outcomes, efg_file, scale = scale)
+    assert '{ 1/3, 1 }' in efg_file.getvalue() and '{ 1/2, 0 }' in efg_file.getvalue()
+
+@pytest.mark.parametrize('numeric', gambitparser.NUMERIC_BACKENDS)
+def test_every_backend_reports_the_same_exact_payoffs(numeric):
+    parser = gambitparser.Parser(2, 2, rational_outcomes(), solver = 'backward', numeric = numeric)
+    parser.build()
+    parser.payoffs()
+    parser.solve()
+    paths, action_payoffs, _, _ = parser.parse(verbose = False)
+    assert paths == [(2, 1)]
+    assert [Fraction(value).limit_denominator(100) for value in action_payoffs[0][1]] == [2, 2]
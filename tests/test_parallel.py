@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+import gambitparser
+from brute_force import brute_force_subgame_perfect, random_games
+
+@pytest.mark.parametrize('split_depth', [None, 1, 2])
+def test_parallel_matches_backward_induction(split_depth):
+    for num_moves, num_players, outcomes in random_games():
+        if num_players < 3:
+            continue
+        leaves = gambitparser.parallel_backward_induction(num_moves, num_players, outcomes, workers = 2, split_depth = split_depth)
+        assert sorted(leaves) == sorted(gambitparser.backward_induction(num_moves, num_players, outcomes.tolist()))
+
+def test_parser_agrees_with_brute_force():
+    for num_moves, num_players, outcomes in random_games():
+        parser = gambitparser.Parser(num_moves, num_players, outcomes.tolist(), solver = 'parallel')
+        parser.build()
+        parser.payoffs()
+        leaves, paths, _ = parser.solve()
+        assert set(leaves) == brute_force_subgame_perfect(num_moves, num_players, outcomes)
+        assert paths == [tuple(parser.tree.path(leaf)) for leaf in leaves]
+
+def test_workers_read_a_payoff_tensor_from_disk(tmp_path):
+    outcomes = np.random.RandomState(3).randint(0, 3, size = (3, 3, 3, 3, 4))
+    np.save(str(tmp_path / 'Game.npy'), outcomes)
+    num_moves, num_players, tensor = gambitparser.load_payoff_tensor(str(tmp_path / 'Game.npy'))
+    leaves = gambitparser.parallel_backward_induction(num_moves, num_players, tensor, workers = 2)
+    assert sorted(leaves) == sorted(gambitparser.backward_induction(3, 4, outcomes.reshape(-1, 4).tolist()))
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+import gambitparser
+
+def test_payoff_tensor_round_trip(tmp_path):
+    text_file = tmp_path / 'Game.txt'
+    text_file.write_text('1,1:1,2\n1,2:3,4\n2,1:5,6\n2,2:7,8\n')
+    assert gambitparser.payoffs_to_tensor(str(text_file), str(tmp_path / 'Game.npy')) == (2, 2)
+    num_moves, num_players, outcomes = gambitparser.load_payoff_tensor(str(tmp_path / 'Game.npy'))
+    assert (num_moves, num_players) == (2, 2)
+    assert outcomes.tolist() == [[1, 2], [3, 4], [5, 6], [7, 8]]
+    gambitparser.tensor_to_payoffs(str(tmp_path / 'Game.npy'), str(tmp_path / 'Back.txt'), chunk_lines = 3)
+    assert (tmp_path / 'Back.txt').read_text() == text_file.read_text()
+
+def test_payoff_tensor_of_the_wrong_shape_is_rejected(tmp_path):
+    np.save(str(tmp_path / 'Game.npy'), np.zeros((2, 3, 2)))
+    with pytest.raises(SystemExit):
+        gambitparser.load_payoff_tensor(str(tmp_path / 'Game.npy'))
+
+def test_tensor_stays_on_disk_through_build(tmp_path):
+    outcomes = np.random.RandomState(0).randint(0, 10, size = (3, 3, 3, 3))
+    np.save(str(tmp_path / 'Game.npy'), outcomes)
+    parser = gambitparser.PayoffParser(str(tmp_path / 'Game.npy'), solver = 'backward')
+    parser.preprocess()
+    parser.build()
+    assert parser.all_paths is None
+    assert isinstance(parser.outcomes, np.memmap)
+    leaves = parser.solve()[0]
+    assert sorted(leaves) == sorted(gambitparser.backward_induction(3, 3, outcomes.reshape(-1, 3).tolist()))
+    assert parser.parse(verbose = False)[0] == [tuple(parser.tree.path(leaf)) for leaf in parser.equilibrium_leaves]
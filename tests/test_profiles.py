@@ -0,0 +1,17 @@
+import gambitparser
+
+def test_parse_profiles_reads_rationals_and_decimals():
+    profiles = gambitparser.parse_profiles('NE,1/2,1/2,0.25,0.75\nnot a profile\n')
+    assert profiles.tolist() == [[0.5, 0.5, 0.25, 0.75]]
+
+def test_decode_profiles_follows_pure_profiles():
+    tree = gambitparser.GameTree(2, 2)
+    profiles = gambitparser.parse_profiles('NE,1,0,1,0,0,1\nNE,0,1,0,1,0,1\n')
+    assert gambitparser.decode_profiles(tree, profiles).tolist() == [0, 3]
+
+def test_decode_profiles_leaves_out_mixed_profiles():
+    tree = gambitparser.GameTree(2, 2)
+    profiles = gambitparser.parse_profiles('NE,1/2,1/2,1,0,0,1\nNE,0,1,0,1,0,1\n')
+    assert gambitparser.pure_profiles(profiles).tolist() == [False, True]
+    assert gambitparser.decode_profiles(tree, profiles).tolist() == [3]
+    assert len(gambitparser.decode_profiles(tree, profiles[:1])) == 0
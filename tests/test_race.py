@@ -0,0 +1,44 @@
+import multiprocessing
+import subprocess
+import time
+
+import pytest
+
+import gambitparser
+
+def slow_solver(num_moves, num_players, outcomes):
+    time.sleep(30)
+    return [0]
+
+def test_race_kills_the_losing_native_solvers():
+    gambitparser.register_solver('slow', function = slow_solver)
+    parser = gambitparser.Parser(2, 2, [[1, -1], [3, -3], [5, -5], [7, -7]], solver = 'alphabeta')
+    parser.build()
+    parser.payoffs()
+    start = time.time()
+    winner, leaves, paths, _ = parser.race(['slow', 'alphabeta'])
+    assert (winner, list(leaves), paths) == ('alphabeta', [2], [(2, 1)])
+    assert parser.game_value == 5
+    assert time.time() - start < 10
+    time.sleep(0.2)
+    assert multiprocessing.active_children() == []
+
+def test_parse_after_a_race():
+    parser = gambitparser.Parser(2, 2, [[1, 2], [3, 4], [5, 6], [7, 8]], solver = 'backward')
+    parser.build()
+    parser.payoffs()
+    winner, _, paths, _ = parser.race(['backward', 'nash'])
+    assert winner in ('backward', 'nash')
+    assert parser.parse(verbose = False)[0] == paths
+
+def test_race_past_the_timeout_raises_timeout_expired():
+    gambitparser.register_solver('slow', function = slow_solver)
+    parser = gambitparser.Parser(2, 2, [[1, 2], [3, 4], [5, 6], [7, 8]], solver = 'backward', timeout = 0.5)
+    parser.build()
+    parser.payoffs()
+    start = time.time()
+    with pytest.raises(subprocess.TimeoutExpired):
+        parser.race(['slow'])
+    assert time.time() - start < 10
+    time.sleep(0.2)
+    assert multiprocessing.active_children() == []
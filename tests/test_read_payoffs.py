@@ -0,0 +1,25 @@
+import io
+
+import pytest
+
+import gambitparser
+
+def read(text, chunk_lines = gambitparser.PAYOFF_CHUNK_LINES):
+    return gambitparser.read_payoffs(io.StringIO(text), chunk_lines)
+
+def test_blank_lines_before_the_payoffs_are_skipped():
+    text = '\n\n1,1:1,2\n1,2:3,4\n\n2,1:5,6\n2,2:7,8\n'
+    for chunk_lines in (1, 2, 100):
+        num_moves, num_players, outcomes = read(text, chunk_lines)
+        assert (num_moves, num_players) == (2, 2)
+        assert outcomes.tolist() == [[1, 2], [3, 4], [5, 6], [7, 8]]
+
+@pytest.mark.parametrize('text', [
+    '1,1:1,2\n1,2:3,4,5\n2,1:5,6\n2,2:7,8\n',
+    '1,1:1,2\n1,2,1:3,4\n2,1:5,6\n2,2:7,8\n',
+    #the lines are off by one in a way that still adds up over the chunk
+    '1,1:1,2\n1,2:3\n2,1:5,6,4\n2,2:7,8\n',
+])
+def test_lines_with_the_wrong_number_of_players_are_rejected(text):
+    with pytest.raises(SystemExit):
+        read(text)
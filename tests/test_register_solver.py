@@ -0,0 +1,23 @@
+import gambitparser
+
+def first_leaf(num_moves, num_players, outcomes):
+    return [0]
+
+def first_leaf_within(num_moves, num_players, outcomes, tolerance = 0):
+    first_leaf_within.tolerance = tolerance
+    return [0]
+
+def solve(solver, numeric):
+    parser = gambitparser.Parser(2, 2, [[1, 2], [3, 4], [5, 6], [7, 8]], solver = solver, numeric = numeric)
+    parser.build()
+    parser.payoffs()
+    return parser.solve()[0]
+
+def test_three_argument_solver_works_with_float_payoffs():
+    gambitparser.register_solver('first', function = first_leaf)
+    assert solve('first', 'float') == [0]
+
+def test_solver_taking_tolerance_is_handed_it():
+    gambitparser.register_solver('first_within', function = first_leaf_within)
+    assert solve('first_within', 'float') == [0]
+    assert first_leaf_within.tolerance == 1e-9
@@ -0,0 +1,37 @@
+import io
+
+import numpy as np
+
+import gambitparser
+
+#just enough of a gambit game to count the outcomes added to it
+class Outcome(dict):
+    def __init__(self, label):
+        self.label = label
+
+class Outcomes(list):
+    def add(self, label):
+        self.append(Outcome(label))
+        return self[-1]
+
+class Game:
+    def __init__(self):
+        self.outcomes = Outcomes()
+
+def test_identical_payoffs_share_one_outcome():
+    game, interned = Game(), {}
+    first = gambitparser.intern_outcome(game, interned, [1, 2], 'a')
+    assert gambitparser.intern_outcome(game, interned, (1, 2), 'b') is first
+    #numpy and float payoffs are the same exact numbers
+    assert gambitparser.intern_outcome(game, interned, np.array([1.0, 2.0]), 'c') is first
+    other = gambitparser.intern_outcome(game, interned, [2, 1], 'd')
+    assert len(game.outcomes) == 2
+    assert (first.label, dict(first), other.label, dict(other)) == ('a', {0: 1, 1: 2}, 'd', {0: 2, 1: 1})
+
+def test_efg_writes_each_distinct_payoff_once():
+    efg_file = io.StringIO()
+    outcomes = [[1, 1], [0, 0], [0, 0], [1, 1], [2, 2], [0, 0], [1, 1], [2, 2], [0, 0]]
+    gambitparser.write_efg(gambitparser.GameTree(3, 2), outcomes, efg_file)
+    leaves = [line for line in efg_file.getvalue().splitlines() if line.startswith('t ')]
+    assert [line.split()[2] for line in leaves] == ['1', '2', '2', '1', '3', '2', '1', '3', '2']
+    assert sum('{' in line for line in leaves) == 3
@@ -0,0 +1,22 @@
+import pickle
+
+import numpy as np
+
+import gambitparser
+
+def game(**options):
+    return gambitparser.Parser(2, 2, [[1, 2], [3, 4], [5, 6], [7, 8]], solver = 'backward', **options)
+
+def test_unpicklable_game_only_fails_its_own_slot():
+    results = gambitparser.solve_many([game(), game(payoff_function = lambda paths: paths), game()], workers = 2)
+    assert results[0][0] == results[2][0] == [(2, 2)]
+    assert isinstance(results[1], (pickle.PicklingError, AttributeError, TypeError))
+
+def test_games_sharing_the_default_title_do_not_mix_up_their_files(fake_gambit):
+    rng = np.random.RandomState(0)
+    outcomes = [np.stack([rng.permutation(25), rng.permutation(25)], axis = 1).tolist() for _ in range(12)]
+    results = gambitparser.solve_many([gambitparser.Parser(5, 2, game_outcomes) for game_outcomes in outcomes], workers = 6)
+    tree = gambitparser.GameTree(5, 2)
+    for game_outcomes, result in zip(outcomes, results):
+        assert result[0] == [tuple(tree.path(leaf)) for leaf in gambitparser.backward_induction(5, 2, game_outcomes)]
+    assert list(fake_gambit.iterdir()) == []
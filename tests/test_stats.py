@@ -0,0 +1,52 @@
+import contextlib
+import json
+
+import gambitparser
+
+def test_phases_add_up_and_call_the_hooks():
+    calls = []
+    stats = gambitparser.Stats(hooks = [lambda phase, seconds: calls.append((phase, seconds))])
+    for _ in range(2):
+        with stats.phase('work'):
+            sum(range(10000))
+    assert [phase for phase, _ in calls] == ['work', 'work']
+    assert abs(stats.durations['work'] - sum(seconds for _, seconds in calls)) < 1e-9
+    assert stats.cpu['work'] >= 0
+
+def test_phase_is_recorded_when_it_raises():
+    stats = gambitparser.Stats()
+    try:
+        with stats.phase('broken'):
+            raise ValueError
+    except ValueError:
+        pass
+    assert 'broken' in stats.durations
+
+def test_tracer_wraps_every_phase():
+    traced = []
+    @contextlib.contextmanager
+    def tracer(name):
+        traced.append(('enter', name))
+        yield
+        traced.append(('exit', name))
+    stats = gambitparser.Stats(tracer = tracer)
+    with stats.phase('solver'):
+        pass
+    assert traced == [('enter', 'solver'), ('exit', 'solver')]
+
+def test_parser_phases_and_counters_go_to_json(fake_gambit):
+    seen = []
+    stats = gambitparser.Stats()
+    stats.add_hook(lambda phase, seconds: seen.append(phase))
+    parser = gambitparser.Parser(2, 2, [[1, 2], [3, 4], [5, 6], [7, 8]], diskless = True, stats = stats)
+    parser.build()
+    parser.payoffs()
+    parser.solve()
+    parser.parse(verbose = False)
+    for phase in ('tree', 'paths', 'outcomes', 'solver', 'decode', 'results', 'payoff_lists'):
+        assert phase in stats.durations
+        assert phase in seen
+    assert stats.counters['stdout_bytes'] > 0
+    text = stats.to_json(str(fake_gambit / 'stats.json'))
+    assert json.loads(text) == stats.as_dict()
+    assert (fake_gambit / 'stats.json').read_text() == text
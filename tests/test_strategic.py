@@ -0,0 +1,35 @@
+import collections
+
+import numpy as np
+import pytest
+
+import gambitparser
+from brute_force import brute_force_nash, play, profiles, random_games
+
+@pytest.mark.parametrize('num_moves, num_players, outcomes', random_games())
+def test_strategic_form_lists_every_equilibrium_profile(num_moves, num_players, outcomes):
+    expected = brute_force_nash(num_moves, num_players, outcomes)
+    #the strategic form lists one leaf per equilibrium profile
+    assert collections.Counter(gambitparser.strategic_nash(num_moves, num_players, outcomes).tolist()) == expected
+
+@pytest.mark.parametrize('num_moves, num_players', [(2, 2), (3, 2), (2, 3)])
+def test_every_strategy_profile_reaches_its_leaf(num_moves, num_players):
+    leaves = gambitparser.strategy_leaves(num_moves, num_players)
+    assert leaves.shape == tuple(num_moves**(num_moves**depth) for depth in range(num_players))
+    #strategy s plays the base num_moves digits of s, the first information set on the first digit
+    for profile in profiles(num_moves, num_players):
+        strategies = tuple(int(''.join(map(str, choices)), num_moves) for choices in profile)
+        assert leaves[strategies] == play(num_moves, num_players, profile)
+
+def test_strategic_form_that_is_too_big_is_refused():
+    with pytest.raises(SystemExit):
+        gambitparser.strategy_leaves(3, 4)
+
+def test_parser_strategic_form():
+    parser = gambitparser.Parser(2, 2, [[1, 1], [0, 0], [0, 0], [1, 1]], solver = 'strategic')
+    parser.build()
+    parser.payoffs()
+    payoffs, equilibria = parser.strategic_form()
+    assert payoffs.shape == (2, 4, 2)
+    assert np.all(payoffs[tuple(equilibria.T)] == 1)
+    assert len(equilibria) == len(parser.solve()[0])
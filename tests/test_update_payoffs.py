@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import gambitparser
+
+def built_game():
+    parser = gambitparser.Parser(2, 2, [[1, 2], [3, 4], [5, 6], [7, 8]], solver = 'backward')
+    parser.build()
+    parser.payoffs()
+    return parser
+
+def test_update_by_path_and_leaf():
+    parser = built_game()
+    parser.update_payoffs({(2, 1): [9, 9], 1: [0, 0]})
+    assert np.asarray(parser.outcomes).tolist() == [[1, 2], [0, 0], [9, 9], [7, 8]]
+
+@pytest.mark.parametrize('path', [(1, 3), (2,), (0, 1), (1, 1, 1)])
+def test_malformed_paths_are_rejected(path):
+    parser = built_game()
+    with pytest.raises(SystemExit):
+        parser.update_payoffs({path: [9, 9]})
+    assert np.asarray(parser.outcomes).tolist() == [[1, 2], [3, 4], [5, 6], [7, 8]]
+
+def test_incremental_backward_matches_full_solve():
+    rng = np.random.RandomState(0)
+    parser = gambitparser.Parser(3, 4, rng.randint(0, 4, size = (81, 4)), solver = 'backward')
+    parser.build()
+    parser.payoffs()
+    parser.solve()
+    for _ in range(5):
+        leaf = int(rng.randint(81))
+        parser.update_payoffs({leaf: rng.randint(0, 4, size = 4).tolist()})
+        leaves, _, _ = parser.solve()
+        assert sorted(leaves) == sorted(gambitparser.backward_induction(3, 4, parser.outcomes))
+
+def test_new_denominator_rescales_every_flat_payoff(tmp_path):
+    text_file = tmp_path / 'Game.txt'
+    text_file.write_text('1,1:1,2\n1,2:3,4\n2,1:5,6\n2,2:7,8\n')
+    parser = gambitparser.PayoffParser(str(text_file), solver = 'backward', numeric = 'scaled')
+    parser.preprocess()
+    parser.build()
+    parser.update_payoffs({0: ['1/3', 1]})
+    assert parser.scale == 3
+    assert parser.outcomes.tolist() == [[1, 3], [9, 12], [15, 18], [21, 24]]
+    assert parser.flat_outs == [1, 3, 9, 12, 15, 18, 21, 24]